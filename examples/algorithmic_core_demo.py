@@ -13,7 +13,6 @@ Algoritmik adımlar:
 7. State Synthesis
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -21,16 +20,21 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from velocity.core.velocity_core import VelocityCore
+from velocity.runtime import run
 from loguru import logger
 
 
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
+
+
 async def main():
     """Algoritmik çekirdeği göster"""
     
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print(" " * 15 + "VELOCITY ALGORITHMIC CORE")
     print(" " * 10 + "Gerçek Algoritmik İmplementasyon")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     # Initialize Core
     core = VelocityCore(
@@ -45,13 +49,13 @@ async def main():
     query = "What is quantum computing and how does it differ from classical computing?"
     
     print(f"\n📝 Query: {query}")
-    print("\n" + "-" * 70)
+    print("\n" + _SEP_DASH)
     
     # ============================================
     # STEP 0: Can this be answered?
     # ============================================
     print("\n[0] PRE-CHECK: Can this be answered?")
-    print("-" * 70)
+    print(_SEP_DASH)
     
     can_answer_result = await core.can_answer(query)
     
@@ -71,31 +75,31 @@ async def main():
     # ============================================
     # MAIN EXECUTION
     # ============================================
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("MAIN EXECUTION")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     result = await core.execute(query, system_goal="answer")
     
     # ============================================
     # RESULTS DISPLAY
     # ============================================
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("RESULTS")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     print(f"\n📊 Decision:")
-    print("-" * 70)
+    print(_SEP_DASH)
     print(result['decision'])
     
     print(f"\n📈 Confidence Metrics:")
-    print("-" * 70)
+    print(_SEP_DASH)
     print(f"  Overall Confidence: {result['confidence']:.2%}")
     print(f"  Confidence Interval: {result['confidence_interval'][0]:.2%} - {result['confidence_interval'][1]:.2%}")
     print(f"  Uncertainty Level: {result['uncertainty']}")
     
     print(f"\n🔬 Evidence:")
-    print("-" * 70)
+    print(_SEP_DASH)
     print(f"  Total pieces: {len(result['evidence'])}")
     for i, evidence in enumerate(result['evidence'][:5], 1):
         print(f"\n  {i}. [{evidence['source']}] (confidence: {evidence['confidence']:.2%})")
@@ -103,7 +107,7 @@ async def main():
     
     if result['contradictions']:
         print(f"\n⚠️  Contradictions:")
-        print("-" * 70)
+        print(_SEP_DASH)
         print(f"  Found: {len(result['contradictions'])}")
         for i, contradiction in enumerate(result['contradictions'], 1):
             print(f"\n  {i}. Severity: {contradiction['severity']:.2f}")
@@ -116,23 +120,23 @@ async def main():
     
     if result['alternatives']:
         print(f"\n🔀 Alternatives:")
-        print("-" * 70)
+        print(_SEP_DASH)
         for i, alternative in enumerate(result['alternatives'], 1):
             print(f"  {i}. {alternative}")
     
     print(f"\n📚 Sources:")
-    print("-" * 70)
+    print(_SEP_DASH)
     for source, count in result['source_breakdown'].items():
         print(f"  • {source}: {count} queries")
     
     print(f"\n🧪 Hypotheses:")
-    print("-" * 70)
+    print(_SEP_DASH)
     print(f"  Total generated: {result['hypotheses']['total']}")
     print(f"  Survived: {result['hypotheses']['surviving']}")
     print(f"  Eliminated: {result['hypotheses']['eliminated']}")
     
     print(f"\n🎯 Intent Analysis:")
-    print("-" * 70)
+    print(_SEP_DASH)
     print(f"  Goal: {result['intent']['goal']}")
     print(f"  Type: {result['intent']['type']}")
     print(f"  Initial Uncertainty: {result['intent']['uncertainty']:.2f}")
@@ -141,9 +145,9 @@ async def main():
     # ============================================
     # KEY INSIGHT
     # ============================================
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("KEY INSIGHT")
-    print("=" * 70)
+    print(_SEP_EQ)
     print("""
 Bu bir LLM cevabı değil, HESAPLANMIŞ bir sonuçtur.
 
@@ -167,17 +171,17 @@ Bu "yüksek seviye laf" değil.
 Bu çalışan, modüler, ölçeklenebilir bir algoritmik iskelet.
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("✅ DEMO COMPLETE")
-    print("=" * 70)
+    print(_SEP_EQ)
 
 
 async def demonstrate_each_step():
     """Her adımı ayrı ayrı göster"""
     
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("STEP-BY-STEP DEMONSTRATION")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     query = "Is coffee healthy?"
     
@@ -189,7 +193,7 @@ async def demonstrate_each_step():
     
     # Step 1: Intent Parsing
     print("\n[1] INTENT PARSING")
-    print("-" * 70)
+    print(_SEP_DASH)
     parser = IntentParser()
     intent = parser.parse(query)
     print(f"Goal: {intent.goal}")
@@ -199,7 +203,7 @@ async def demonstrate_each_step():
     
     # Step 2: Epistemic Routing
     print("\n[2] EPISTEMIC ROUTING")
-    print("-" * 70)
+    print(_SEP_DASH)
     router = EpistemicRouter()
     strategies = router.route(intent, max_strategies=3)
     print(f"Selected {len(strategies)} strategies:")
@@ -211,7 +215,7 @@ async def demonstrate_each_step():
     
     # Step 3: Hypothesis Generation
     print("\n[3] HYPOTHESIS GENERATION")
-    print("-" * 70)
+    print(_SEP_DASH)
     generator = HypothesisGenerator(max_hypotheses=3)
     hypotheses = generator.generate(intent, strategies)
     print(f"Generated {len(hypotheses)} hypotheses:")
@@ -235,12 +239,12 @@ if __name__ == "__main__":
     choice = input("\nSelect demo:\n  1. Full execution\n  2. Step-by-step\n  3. Both\n\nChoice [1]: ").strip() or "1"
     
     if choice == "1":
-        asyncio.run(main())
+        run(main())
     elif choice == "2":
-        asyncio.run(demonstrate_each_step())
+        run(demonstrate_each_step())
     elif choice == "3":
-        asyncio.run(demonstrate_each_step())
-        print("\n" + "=" * 70 + "\n")
-        asyncio.run(main())
+        run(demonstrate_each_step())
+        print("\n" + _SEP_EQ + "\n")
+        run(main())
     else:
         print("Invalid choice")
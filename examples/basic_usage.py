@@ -4,7 +4,6 @@ Basic Usage Example
 Demonstrates the Velocity Paradigm in action.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -12,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from velocity import VelocityEngine
+from velocity.runtime import run
 from loguru import logger
 
 
@@ -88,4 +88,4 @@ Network-native, dataset-free general intelligence.
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
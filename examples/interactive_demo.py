@@ -4,7 +4,6 @@ Interactive Velocity Demo
 An interactive demonstration of the Velocity Paradigm.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -12,9 +11,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from velocity import VelocityEngine
+from velocity.runtime import run
 from loguru import logger
 
 
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
+
+# Confidence readings, highest threshold first
+_INTERPRETATIONS = (
+    (0.7, "High confidence - strong evidence from multiple sources"),
+    (0.4, "Moderate confidence - some evidence but gaps remain"),
+)
+
+
 class VelocityDemo:
     """Interactive Velocity demonstration"""
     
@@ -28,20 +38,20 @@ class VelocityDemo:
     
     def print_header(self):
         """Print demo header"""
-        print("\n" + "=" * 70)
+        print("\n" + _SEP_EQ)
         print(" " * 20 + "VELOCITY PARADIGM")
         print(" " * 10 + "Network-Native, Dataset-Free General Intelligence")
-        print("=" * 70)
+        print(_SEP_EQ)
         print("\nKey Concepts:")
         print("  • Intelligence = Speed of interrogation, not size of memory")
         print("  • Knowledge lives in the network, not in weights")
         print("  • Contradictions are signals, not errors")
         print("  • State-driven, not token-driven")
-        print("=" * 70)
+        print(_SEP_EQ)
     
     def print_menu(self):
         """Print menu options"""
-        print("\n" + "-" * 70)
+        print("\n" + _SEP_DASH)
         print("Options:")
         print("  1. Quick query (default)")
         print("  2. Detailed query (with state inspection)")
@@ -49,7 +59,7 @@ class VelocityDemo:
         print("  4. Uncertainty demo (ambiguous topic)")
         print("  5. Custom configuration")
         print("  q. Quit")
-        print("-" * 70)
+        print(_SEP_DASH)
     
     async def quick_query(self, query: str = None):
         """Execute a quick query"""
@@ -64,9 +74,9 @@ class VelocityDemo:
         
         result = await self.engine.interrogate(query)
         
-        print("=" * 70)
+        print(_SEP_EQ)
         print("RESULT")
-        print("=" * 70)
+        print(_SEP_EQ)
         print(f"\n{result['answer']}")
         print(f"\n📊 Confidence: {result['confidence']:.1%}")
         print(f"📚 Sources: {len(result['sources'])}")
@@ -88,14 +98,14 @@ class VelocityDemo:
         result = await self.engine.interrogate(query)
         state = result['state']
         
-        print("=" * 70)
+        print(_SEP_EQ)
         print("RESULT")
-        print("=" * 70)
+        print(_SEP_EQ)
         print(f"\n{result['answer']}")
         
-        print("\n" + "-" * 70)
+        print("\n" + _SEP_DASH)
         print("COGNITIVE STATE")
-        print("-" * 70)
+        print(_SEP_DASH)
         print(f"\n📊 Overall Confidence: {state.confidence:.1%}")
         print(f"🎯 Uncertainty Level: {state.uncertainty.name}")
         print(f"📚 Topics Explored: {len(state.knowledge)}")
@@ -111,9 +121,9 @@ class VelocityDemo:
                 print(f"     B: {contradiction.claim_b[:60]}...")
                 print(f"        (from {contradiction.source_b})")
         
-        print("\n" + "-" * 70)
+        print("\n" + _SEP_DASH)
         print("EVIDENCE BREAKDOWN")
-        print("-" * 70)
+        print(_SEP_DASH)
         for topic, evidence_list in state.knowledge.items():
             print(f"\n📂 {topic}:")
             for i, evidence in enumerate(evidence_list[:5], 1):
@@ -121,9 +131,9 @@ class VelocityDemo:
                       f"Confidence: {evidence.confidence:.1%}")
                 print(f"     {evidence.content[:80]}...")
         
-        print("\n" + "-" * 70)
+        print("\n" + _SEP_DASH)
         print("ENGINE STATISTICS")
-        print("-" * 70)
+        print(_SEP_DASH)
         stats = self.engine.get_state_summary()
         print(f"\nNetwork Interrogator:")
         print(f"  • Queries executed: {stats['interrogator']['queries_executed']}")
@@ -135,9 +145,9 @@ class VelocityDemo:
     
     async def contradiction_demo(self):
         """Demonstrate contradiction handling"""
-        print("\n" + "=" * 70)
+        print("\n" + _SEP_EQ)
         print("CONTRADICTION DETECTION DEMO")
-        print("=" * 70)
+        print(_SEP_EQ)
         print("\nContradictions are not errors in Velocity.")
         print("They are signals of information density and multiple perspectives.")
         
@@ -167,9 +177,9 @@ class VelocityDemo:
         result = await self.engine.interrogate(query)
         state = result['state']
         
-        print("=" * 70)
+        print(_SEP_EQ)
         print("CONTRADICTIONS FOUND")
-        print("=" * 70)
+        print(_SEP_EQ)
         
         if state.contradictions:
             print(f"\n✓ Found {len(state.contradictions)} contradictions")
@@ -191,9 +201,9 @@ class VelocityDemo:
     
     async def uncertainty_demo(self):
         """Demonstrate uncertainty tracking"""
-        print("\n" + "=" * 70)
+        print("\n" + _SEP_EQ)
         print("UNCERTAINTY TRACKING DEMO")
-        print("=" * 70)
+        print(_SEP_EQ)
         print("\nVelocity explicitly tracks uncertainty.")
         print("Uncertainty guides when to search more vs when to conclude.")
         
@@ -208,9 +218,9 @@ class VelocityDemo:
         result = await self.engine.interrogate(query)
         state = result['state']
         
-        print("=" * 70)
+        print(_SEP_EQ)
         print("UNCERTAINTY ANALYSIS")
-        print("=" * 70)
+        print(_SEP_EQ)
         
         print(f"\n📊 Confidence: {state.confidence:.1%}")
         print(f"🎯 Uncertainty: {state.uncertainty.name}")
@@ -224,18 +234,16 @@ class VelocityDemo:
         print(f"🔄 Iterations used: {result['iterations']}")
         
         print("\n💡 Interpretation:")
-        if state.confidence > 0.7:
-            print("  High confidence - strong evidence from multiple sources")
-        elif state.confidence > 0.4:
-            print("  Moderate confidence - some evidence but gaps remain")
-        else:
-            print("  Low confidence - limited or conflicting evidence")
+        print("  " + next(
+            (text for threshold, text in _INTERPRETATIONS if state.confidence > threshold),
+            "Low confidence - limited or conflicting evidence"
+        ))
     
     async def custom_config(self):
         """Configure engine parameters"""
-        print("\n" + "=" * 70)
+        print("\n" + _SEP_EQ)
         print("CUSTOM CONFIGURATION")
-        print("=" * 70)
+        print(_SEP_EQ)
         
         print("\nCurrent configuration:")
         print(f"  • Max parallel queries: {self.engine.max_parallel_queries}")
@@ -306,6 +314,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
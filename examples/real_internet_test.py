@@ -12,19 +12,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from velocity.core.velocity_core import VelocityCore
+from velocity.core.defaults import DEFAULT_CORE_KWARGS
+from velocity.runtime import run
+
+
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
 
 
 async def test_real_search():
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("VELOCITY - REAL INTERNET SEARCH TEST")
-    print("=" * 70)
+    print(_SEP_EQ)
     
-    core = VelocityCore(
-        max_hypotheses=2,
-        confidence_threshold=0.6,
-        max_iterations=3,
-        budget_per_hypothesis=3.0
-    )
+    core = VelocityCore(**DEFAULT_CORE_KWARGS, budget_per_hypothesis=3.0)
     
     # Test queries
     queries = [
@@ -33,38 +34,52 @@ async def test_real_search():
         "Artificial intelligence",
     ]
     
-    for i, query in enumerate(queries, 1):
+    # Drop repeats (ignoring case/spacing) so each topic is searched once
+    unique = {}
+    for query in queries:
+        unique.setdefault(" ".join(query.lower().split()), query)
+    queries = list(unique.values())
+    
+    # Queries are independent and network-bound: run them concurrently,
+    # then print the reports in order so the output stays readable.
+    try:
+        results = await asyncio.gather(
+            *(core.execute(query) for query in queries),
+            return_exceptions=True
+        )
+    finally:
+        await core.close()
+    
+    for i, (query, result) in enumerate(zip(queries, results), 1):
         print(f"\n[TEST {i}/{len(queries)}] Query: {query}")
-        print("-" * 70)
+        print(_SEP_DASH)
+        
+        if isinstance(result, Exception):
+            print(f"\n[ERROR] Test {i} failed: {result}")
+            print("\n" + _SEP_EQ)
+            continue
+        
+        print(f"\n[RESULT]")
+        print(f"  Confidence: {result['confidence']:.2%}")
+        print(f"  Uncertainty: {result['uncertainty']}")
+        print(f"  Evidence: {len(result['evidence'])} pieces")
+        print(f"  Sources: {len(result['source_breakdown'])}")
+        
+        # Show sources
+        if result['source_breakdown']:
+            print(f"\n[SOURCES]")
+            for source, count in result['source_breakdown'].items():
+                print(f"  - {source}: {count} queries")
         
-        try:
-            result = await core.execute(query)
-            
-            print(f"\n[RESULT]")
-            print(f"  Confidence: {result['confidence']:.2%}")
-            print(f"  Uncertainty: {result['uncertainty']}")
-            print(f"  Evidence: {len(result['evidence'])} pieces")
-            print(f"  Sources: {len(result['source_breakdown'])}")
-            
-            # Show sources
-            if result['source_breakdown']:
-                print(f"\n[SOURCES]")
-                for source, count in result['source_breakdown'].items():
-                    print(f"  - {source}: {count} queries")
-            
-            # Show decision preview
-            decision = result['decision']
-            if len(decision) > 300:
-                decision = decision[:300] + "..."
-            print(f"\n[DECISION]")
-            print(f"  {decision}")
-            
-            print(f"\n[OK] Test {i} complete!")
-            
-        except Exception as e:
-            print(f"\n[ERROR] Test {i} failed: {e}")
+        # Show decision preview
+        decision = result['decision']
+        if len(decision) > 300:
+            decision = decision[:300] + "..."
+        print(f"\n[DECISION]")
+        print(f"  {decision}")
         
-        print("\n" + "=" * 70)
+        print(f"\n[OK] Test {i} complete!")
+        print("\n" + _SEP_EQ)
     
     print("\n[SUCCESS] All tests complete!")
     print("\nVelocity is now querying the REAL INTERNET!")
@@ -75,6 +90,6 @@ async def test_real_search():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(test_real_search())
+        run(test_real_search())
     except KeyboardInterrupt:
         print("\n\n[!] Interrupted")
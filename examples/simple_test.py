@@ -4,42 +4,42 @@ Simple Test - Velocity Algorithmic Core
 Basit test - emoji yok, ozel karakter yok.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from velocity.core.velocity_core import VelocityCore
+from velocity.core.defaults import DEFAULT_CORE_KWARGS
+from velocity.runtime import run
+
+
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
 
 
 async def main():
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("VELOCITY ALGORITHMIC CORE - SIMPLE TEST")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     # Initialize
-    core = VelocityCore(
-        max_hypotheses=2,
-        confidence_threshold=0.6,
-        max_iterations=3,
-        budget_per_hypothesis=3.0
-    )
+    core = VelocityCore(**DEFAULT_CORE_KWARGS, budget_per_hypothesis=3.0)
     
     # Test query
     query = "What is Python programming language?"
     
     print(f"\n[Q] Query: {query}")
-    print("-" * 70)
+    print(_SEP_DASH)
     
     # Execute
     print("\n[*] Executing Velocity Core...")
     result = await core.execute(query)
     
     # Results
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("RESULTS")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     print(f"\nDecision: {result['decision'][:200]}...")
     print(f"\nConfidence: {result['confidence']:.2%}")
@@ -51,9 +51,9 @@ async def main():
           f"{result['hypotheses']['surviving']}/"
           f"{result['hypotheses']['eliminated']}")
     
-    print("\n" + "=" * 70)
+    print("\n" + _SEP_EQ)
     print("[OK] TEST COMPLETE")
-    print("=" * 70)
+    print(_SEP_EQ)
     
     print("\nKEY INSIGHT:")
     print("  LLM:      'Bu soruya cevap uret'")
@@ -67,6 +67,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n\n[!] Interrupted")
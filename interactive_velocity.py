@@ -3,15 +3,24 @@ VELOCITY - INTERACTIVE MODE
 
 Real-time Q&A with the Velocity cognitive engine.
 7-step algorithmic loop running on every question!
+
+Usage:
+    python interactive_velocity.py               # interactive mode
+    python interactive_velocity.py <question>    # single question
 """
 
+from __future__ import annotations
+
 import asyncio
 import time
-from velocity.core.velocity_core import VelocityCore
-from velocity.synthesis.llm_synthesizer import SynthesisConfig, LLMProvider
-from loguru import logger
 import sys
-import os
+import threading
+from typing import TYPE_CHECKING
+
+# The engine and loguru are imported on first use so that `--help`
+# (and the banner) show up without loading the whole network stack.
+if TYPE_CHECKING:
+    from velocity.core.velocity_core import VelocityCore
 
 
 # ── ANSI colours (work on all modern terminals) ──────────────────────
@@ -26,6 +35,98 @@ _BLUE    = "\033[94m"
 
 _LINE = f"{_DIM}{'─' * 70}{_RESET}"
 
+_BANNER = f"""
+  {_BOLD}{_CYAN}╔══════════════════════════════════════════════════════════════╗{_RESET}
+  {_BOLD}{_CYAN}║{_RESET}   {_BOLD}VELOCITY{_RESET}  —  Network-Native Epistemic Intelligence       {_BOLD}{_CYAN}║{_RESET}
+  {_BOLD}{_CYAN}╚══════════════════════════════════════════════════════════════╝{_RESET}
+  {_DIM}Ask anything. Velocity searches the web, verifies facts,{_RESET}
+  {_DIM}and synthesises a calibrated answer in real-time.{_RESET}
+  {_DIM}Type 'exit' to quit  •  'help' for commands{_RESET}
+"""
+
+_HELP = f"""
+{_LINE}
+  {_BOLD}VELOCITY — Help{_RESET}
+{_LINE}
+  {_CYAN}Pipeline:{_RESET}
+    1. Parse intent          5. Detect contradictions
+    2. Route to sources       6. Eliminate weak hypotheses
+    3. Generate hypotheses    7. Synthesise answer
+    4. Interrogate the web    8. LLM polish (optional)
+
+  {_CYAN}Examples:{_RESET}
+    • What is quantum computing?
+    • Python nedir?
+    • Compare React vs Vue
+    • Atatürk kimdir?
+
+  {_CYAN}Commands:{_RESET}
+    exit / quit / q / cikis — Exit program
+    help / h / yardim       — Show this help
+{_LINE}
+"""
+
+_EXIT_COMMANDS = frozenset({'exit', 'quit', 'q', 'cikis'})
+_HELP_COMMANDS = frozenset({'help', 'h', 'yardim'})
+
+_PROMPT_FMT = f"  {_BOLD}{_BLUE}[{{n}}] ❯{_RESET} "
+
+# Progress line, overwritten in place by the ready/error status
+_THINKING = f"\n  {_DIM}⏳ Velocity is thinking…{_RESET}"
+
+
+def build_core() -> VelocityCore:
+    """
+    Build the engine shared by interactive and single-question mode.
+
+    Qwen3 is configured for LLM polish; if the LLM layer cannot be
+    initialised, Velocity falls back to pure NNEI.
+    """
+    from velocity.core.velocity_core import VelocityCore
+    from velocity.core.defaults import DEFAULT_CORE_KWARGS, DEFAULT_LLM_KWARGS
+    from velocity.synthesis.llm_synthesizer import SynthesisConfig
+    from loguru import logger
+
+    try:
+        return VelocityCore(
+            **DEFAULT_CORE_KWARGS,
+            llm_config=SynthesisConfig(**DEFAULT_LLM_KWARGS),
+            enable_llm=True
+        )
+    except Exception as e:
+        logger.warning(f"LLM init failed: {e}")
+        return VelocityCore(**DEFAULT_CORE_KWARGS, enable_llm=False)
+
+
+async def async_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    The read runs on a daemon thread rather than the default executor so
+    that Ctrl+C can exit the program while input() is still waiting.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(value=None, error=None):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def _read():
+        try:
+            line = input(prompt)
+        except Exception as e:
+            loop.call_soon_threadsafe(_resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(_resolve, line)
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
 
 async def ask_velocity(question: str, core: VelocityCore) -> dict:
     """
@@ -36,7 +137,8 @@ async def ask_velocity(question: str, core: VelocityCore) -> dict:
     print(_LINE)
 
     t0 = time.time()
-    print(f"\n  {_DIM}⏳ Velocity is thinking…{_RESET}", end="", flush=True)
+    sys.stdout.write(_THINKING)
+    sys.stdout.flush()
 
     try:
         result = await core.execute(question)
@@ -49,25 +151,28 @@ async def ask_velocity(question: str, core: VelocityCore) -> dict:
         print(f"  {_LINE}")
         decision = result['decision']
 
-        # Indent every line for clean presentation
+        # Indent every line for clean presentation, then emit in one write
+        buf = []
         for line in decision.splitlines():
             line = line.rstrip()
             if line.startswith("Key Facts:"):
-                print(f"  {_YELLOW}{_BOLD}{line}{_RESET}")
-            elif line.strip().startswith("•"):
-                print(f"  {_GREEN}{line}{_RESET}")
+                buf.append(f"  {_YELLOW}{_BOLD}{line}{_RESET}")
+            elif line.lstrip().startswith("•"):
+                buf.append(f"  {_GREEN}{line}{_RESET}")
             elif line.startswith("Sources:"):
-                print(f"  {_DIM}{line}{_RESET}")
+                buf.append(f"  {_DIM}{line}{_RESET}")
             elif line.startswith("Confidence:"):
                 # Colour-code by confidence level
                 colour = _GREEN if "High" in line else _YELLOW if "Moderate" in line else _MAGENTA
-                print(f"  {colour}{line}{_RESET}")
+                buf.append(f"  {colour}{line}{_RESET}")
             elif line == "":
-                print()
+                buf.append("")
             else:
-                print(f"  {line}")
-        print(f"  {_LINE}")
-        print()
+                buf.append(f"  {line}")
+        buf.append(f"  {_LINE}")
+        buf.append("")
+        sys.stdout.write("\n".join(buf) + "\n")
+        sys.stdout.flush()
 
         return result
 
@@ -75,6 +180,7 @@ async def ask_velocity(question: str, core: VelocityCore) -> dict:
         elapsed = time.time() - t0
         print(f"\r  {_MAGENTA}✗ Error ({elapsed:.1f}s){_RESET}          ")
         print(f"\n  {_MAGENTA}[ERROR] {e}{_RESET}")
+        from loguru import logger
         logger.error(f"Query failed: {e}")
         raise
 
@@ -82,103 +188,65 @@ async def ask_velocity(question: str, core: VelocityCore) -> dict:
 async def interactive_mode():
     """Interactive Q&A mode with a polished terminal interface."""
     # ── Banner ───────────────────────────────────────────────────
-    print()
-    print(f"  {_BOLD}{_CYAN}╔══════════════════════════════════════════════════════════════╗{_RESET}")
-    print(f"  {_BOLD}{_CYAN}║{_RESET}   {_BOLD}VELOCITY{_RESET}  —  Network-Native Epistemic Intelligence       {_BOLD}{_CYAN}║{_RESET}")
-    print(f"  {_BOLD}{_CYAN}╚══════════════════════════════════════════════════════════════╝{_RESET}")
-    print(f"  {_DIM}Ask anything. Velocity searches the web, verifies facts,{_RESET}")
-    print(f"  {_DIM}and synthesises a calibrated answer in real-time.{_RESET}")
-    print(f"  {_DIM}Type 'exit' to quit  •  'help' for commands{_RESET}")
-    print()
+    print(_BANNER)
 
     # ── Init engine ──────────────────────────────────────────────
     print(f"  {_DIM}[init] Checking LLM backend…{_RESET}")
 
-    llm_config = SynthesisConfig(
-        provider=LLMProvider.OLLAMA,
-        model="qwen3:8b",
-        temperature=0.3,
-        max_tokens=500,
-        ollama_host="http://localhost:11434",
-        fallback_to_raw=True
-    )
-
-    try:
-        core = VelocityCore(
-            max_hypotheses=2,
-            confidence_threshold=0.6,
-            max_iterations=3,
-            llm_config=llm_config,
-            enable_llm=True
-        )
-
-        if core.llm_synthesizer:
-            is_available = await core.llm_synthesizer.health_check()
-            if is_available:
-                print(f"  {_GREEN}✓ Qwen3 8B connected (Hybrid mode){_RESET}")
-            else:
-                print(f"  {_YELLOW}⚠ Ollama offline → Pure NNEI mode{_RESET}")
-                print(f"  {_DIM}  (start Ollama for LLM-enhanced answers){_RESET}")
-
-    except Exception as e:
+    core = build_core()
+
+    warmup = None
+    if core.llm_synthesizer:
+        is_available = await core.llm_synthesizer.health_check()
+        if is_available:
+            # Load the model while the user types the first question
+            warmup = asyncio.create_task(core.llm_synthesizer.warmup())
+            print(f"  {_GREEN}✓ Qwen3 8B connected (Hybrid mode){_RESET}")
+        else:
+            print(f"  {_YELLOW}⚠ Ollama offline → Pure NNEI mode{_RESET}")
+            print(f"  {_DIM}  (start Ollama for LLM-enhanced answers){_RESET}")
+    else:
         print(f"  {_YELLOW}⚠ LLM init failed → Pure NNEI mode{_RESET}")
-        core = VelocityCore(
-            max_hypotheses=2,
-            confidence_threshold=0.6,
-            max_iterations=3,
-            enable_llm=False
-        )
 
     print(f"  {_GREEN}✓ Velocity ready{_RESET}\n")
 
     question_count = 0
 
-    while True:
-        try:
-            question_count += 1
-            user_input = input(f"  {_BOLD}{_BLUE}[{question_count}] ❯{_RESET} ").strip()
+    try:
+        while True:
+            try:
+                question_count += 1
+                user_input = (await async_input(_PROMPT_FMT.format(n=question_count))).strip()
 
-            if not user_input:
-                continue
+                if not user_input:
+                    continue
 
-            if user_input.lower() in ['exit', 'quit', 'q']:
-                print(f"\n  {_DIM}Goodbye! 👋{_RESET}\n")
-                break
+                command = user_input.lower()
+                if command in _EXIT_COMMANDS:
+                    print(f"\n  {_DIM}Goodbye! 👋{_RESET}\n")
+                    break
 
-            if user_input.lower() == 'help':
-                print(f"\n{_LINE}")
-                print(f"  {_BOLD}VELOCITY — Help{_RESET}")
-                print(f"{_LINE}")
-                print(f"  {_CYAN}Pipeline:{_RESET}")
-                print(f"    1. Parse intent          5. Detect contradictions")
-                print(f"    2. Route to sources       6. Eliminate weak hypotheses")
-                print(f"    3. Generate hypotheses    7. Synthesise answer")
-                print(f"    4. Interrogate the web    8. LLM polish (optional)")
-                print()
-                print(f"  {_CYAN}Examples:{_RESET}")
-                print(f"    • What is quantum computing?")
-                print(f"    • Python nedir?")
-                print(f"    • Compare React vs Vue")
-                print(f"    • Atatürk kimdir?")
-                print()
-                print(f"  {_CYAN}Commands:{_RESET}")
-                print(f"    exit / quit / q — Exit program")
-                print(f"    help            — Show this help")
-                print(f"{_LINE}\n")
-                continue
+                if command in _HELP_COMMANDS:
+                    print(_HELP)
+                    continue
 
-            await ask_velocity(user_input, core)
+                await ask_velocity(user_input, core)
 
-        except KeyboardInterrupt:
-            print(f"\n\n  {_DIM}Interrupted. Goodbye! 👋{_RESET}\n")
-            break
-        except EOFError:
-            print(f"\n\n  {_DIM}End of input. Goodbye! 👋{_RESET}\n")
-            break
-        except Exception as e:
-            print(f"\n  {_MAGENTA}[ERROR] {e}{_RESET}")
-            logger.error(f"Interactive mode error: {e}")
-            continue
+            except KeyboardInterrupt:
+                print(f"\n\n  {_DIM}Interrupted. Goodbye! 👋{_RESET}\n")
+                break
+            except EOFError:
+                print(f"\n\n  {_DIM}End of input. Goodbye! 👋{_RESET}\n")
+                break
+            except Exception as e:
+                print(f"\n  {_MAGENTA}[ERROR] {e}{_RESET}")
+                from loguru import logger
+                logger.error(f"Interactive mode error: {e}")
+                continue
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+        await core.close()
 
 
 async def main():
@@ -188,44 +256,29 @@ async def main():
     if len(sys.argv) > 1:
         # Single question mode
         question = ' '.join(sys.argv[1:])
-        
-        # Configure Qwen3 for single question too
-        llm_config = SynthesisConfig(
-            provider=LLMProvider.OLLAMA,
-            model="qwen3:8b",
-            temperature=0.3,
-            fallback_to_raw=True
-        )
-        
+        core = build_core()
         try:
-            core = VelocityCore(
-                max_hypotheses=2,
-                confidence_threshold=0.6,
-                max_iterations=3,
-                llm_config=llm_config,
-                enable_llm=True
-            )
-        except:
-            # Fallback to pure NNEI
-            core = VelocityCore(
-                max_hypotheses=2,
-                confidence_threshold=0.6,
-                max_iterations=3,
-                enable_llm=False
-            )
-        
-        await ask_velocity(question, core)
+            await ask_velocity(question, core)
+        finally:
+            await core.close()
     else:
         # Interactive mode
         await interactive_mode()
 
 
 if __name__ == "__main__":
+    # Answer --help before anything pulls in the engine
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        print(__doc__)
+        sys.exit(0)
+
     try:
-        asyncio.run(main())
+        from velocity.runtime import run
+        run(main())
     except KeyboardInterrupt:
         print("\n\n[OK] Goodbye!")
     except Exception as e:
         print(f"\n[FATAL ERROR] {e}")
+        from loguru import logger
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
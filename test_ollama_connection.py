@@ -4,15 +4,23 @@ Quick test to debug Ollama connection
 import asyncio
 import httpx
 
+from velocity.runtime import run
+
+
+_SEP_EQ = "=" * 70
+
+
 async def test_ollama():
-    print("="*70)
+    print(_SEP_EQ)
     print("OLLAMA CONNECTION TEST")
-    print("="*70)
+    print(_SEP_EQ)
     
-    # Test 1: Is Ollama running?
-    print("\n[TEST 1] Checking if Ollama is running...")
-    try:
-        async with httpx.AsyncClient(timeout=5) as client:
+    # One client for every probe, so the loopback connection is reused
+    async with httpx.AsyncClient(timeout=httpx.Timeout(5.0, read=30.0)) as client:
+        # Test 1: Is Ollama running?
+        print("\n[TEST 1] Checking if Ollama is running...")
+        models = []
+        try:
             response = await client.get("http://localhost:11434/api/tags")
             if response.status_code == 200:
                 print("✓ Ollama is running")
@@ -22,53 +30,71 @@ async def test_ollama():
                     print(f"    - {model['name']}")
             else:
                 print(f"✗ Ollama responded with status {response.status_code}")
-    except Exception as e:
-        print(f"✗ Ollama not accessible: {e}")
-        print("\n  Solution: Start Ollama")
-        print("  Windows: Launch Ollama app")
-        print("  Or run: ollama serve")
-        return
-    
-    # Test 2: Can we generate with qwen3:8b?
-    print("\n[TEST 2] Testing qwen3:8b generation...")
-    url = "http://localhost:11434/api/generate"
-    
-    # Try different model names
-    model_names = ["qwen3:8b", "qwen2.5:7b", "qwen2.5:latest"]
-    
-    for model_name in model_names:
-        print(f"\n  Trying model: {model_name}")
-        payload = {
-            "model": model_name,
-            "prompt": "Say hello in one sentence",
-            "stream": False,
-            "options": {
-                "num_predict": 50
-            }
-        }
-        
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(url, json=payload)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    generated = result.get('response', 'N/A')
-                    print(f"  ✓ Success! Model works.")
-                    print(f"    Generated: {generated[:100]}")
-                    print(f"\n  → Use this model name in interactive_velocity.py")
-                    break
-                else:
-                    print(f"  ✗ Failed with status {response.status_code}")
-                    print(f"    Response: {response.text[:200]}")
-        except httpx.TimeoutException:
-            print(f"  ✗ Timeout (model might be loading...)")
         except Exception as e:
-            print(f"  ✗ Error: {e}")
+            print(f"✗ Ollama not accessible: {e}")
+            print("\n  Solution: Start Ollama")
+            print("  Windows: Launch Ollama app")
+            print("  Or run: ollama serve")
+            return
+        
+        # Test 2: Can we generate with qwen3:8b?
+        print("\n[TEST 2] Testing qwen3:8b generation...")
+        url = "http://localhost:11434/api/generate"
+        
+        # Try different model names, all at once; report in preference order
+        model_names = ["qwen3:8b", "qwen2.5:7b", "qwen2.5:latest"]
+        
+        # An empty prompt only loads the weights, so the cold start stays out
+        # of the probe below. Warm just the preferred installed model: loading
+        # every candidate at once would evict models and compete for memory
+        installed = {model['name'] for model in models}
+        model_under_test = next((m for m in model_names if m in installed), None)
+        if model_under_test:
+            try:
+                await client.post(url, json={
+                    "model": model_under_test,
+                    "prompt": "",
+                    "keep_alive": "5m"
+                })
+            except httpx.HTTPError as e:
+                print(f"  ✗ Could not preload {model_under_test}: {e}")
+        
+        responses = await asyncio.gather(
+            *(
+                client.post(url, json={
+                    "model": model_name,
+                    "prompt": "Say hello in one sentence",
+                    "stream": False,
+                    "options": {
+                        "num_predict": 50
+                    }
+                })
+                for model_name in model_names
+            ),
+            return_exceptions=True
+        )
+        
+        for model_name, response in zip(model_names, responses):
+            print(f"\n  Trying model: {model_name}")
+            
+            if isinstance(response, httpx.TimeoutException):
+                print(f"  ✗ Timeout (model might be loading...)")
+            elif isinstance(response, Exception):
+                print(f"  ✗ Error: {response}")
+            elif response.status_code == 200:
+                result = response.json()
+                generated = result.get('response', 'N/A')
+                print(f"  ✓ Success! Model works.")
+                print(f"    Generated: {generated[:100]}")
+                print(f"\n  → Use this model name in interactive_velocity.py")
+                break
+            else:
+                print(f"  ✗ Failed with status {response.status_code}")
+                print(f"    Response: {response.text[:200]}")
     
-    print("\n" + "="*70)
+    print("\n" + _SEP_EQ)
     print("TEST COMPLETE")
-    print("="*70)
+    print(_SEP_EQ)
 
 if __name__ == "__main__":
-    asyncio.run(test_ollama())
+    run(test_ollama())
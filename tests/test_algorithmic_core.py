@@ -343,7 +343,10 @@ async def test_full_integration():
     )
     
     # Simple query
-    result = await core.execute("What is Python?")
+    try:
+        result = await core.execute("What is Python?")
+    finally:
+        await core.close()
     
     # Should have result
     assert result
@@ -2,9 +2,22 @@
 Tests for QueryCache
 """
 
+import asyncio
+
 import pytest
-import time
 from velocity.core.cache import QueryCache
+from velocity.core.disk_cache import DiskCache
+from velocity.core.semantic_cache import SemanticQueryCache
+
+
+class FakeClock:
+    """Manually advanced clock so TTL tests never sleep."""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
 
 
 class TestQueryCache:
@@ -51,16 +64,33 @@ class TestQueryCache:
 
     def test_ttl_expiry(self):
         """Entries older than TTL should return None."""
-        cache = QueryCache(ttl_seconds=0.05)  # 50 ms TTL
+        clock = FakeClock()
+        cache = QueryCache(ttl_seconds=0.05, clock=clock)  # 50 ms TTL
         cache.set("q", "value")
         assert cache.get("q") == "value"
-        time.sleep(0.1)
+        clock.t += 0.1
         assert cache.get("q") is None  # expired
 
+    def test_expired_entry_purged_before_lru_eviction(self):
+        """A full cache drops an expired entry rather than the live LRU one."""
+        clock = FakeClock()
+        cache = QueryCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("q1", "v1")           # expires at t=10
+        clock.t = 5
+        cache.set("q2", "v2")           # expires at t=15
+        clock.t = 6
+        cache.get("q1")                 # q1 is now MRU, q2 is LRU
+        clock.t = 11
+        cache.set("q3", "v3")
+        assert cache.size == 2
+        assert cache.get("q2") == "v2"
+        assert cache.get("q3") == "v3"
+
     def test_ttl_zero_never_expires(self):
-        cache = QueryCache(ttl_seconds=0)
+        clock = FakeClock()
+        cache = QueryCache(ttl_seconds=0, clock=clock)
         cache.set("q", "persistent")
-        time.sleep(0.05)
+        clock.t += 1e9
         assert cache.get("q") == "persistent"
 
     def test_invalidate(self):
@@ -78,6 +108,45 @@ class TestQueryCache:
         assert cache.size == 0
         assert cache.get("q1") is None
 
+    def test_clear_keeps_shared_key_memo(self):
+        """The key memo is process-wide; one cache's clear() must not wipe it."""
+        QueryCache().set("What is Python?", "v")
+        before = QueryCache._make_key.cache_info().currsize
+        QueryCache().clear()
+        assert QueryCache._make_key.cache_info().currsize == before > 0
+
+    def test_key_is_memoised(self):
+        """Repeated raw queries reuse the normalised key."""
+        QueryCache._make_key.cache_clear()
+        cache = QueryCache()
+        cache.set("What is Python?", "v")
+        cache.get("What is Python?")
+        assert QueryCache._make_key.cache_info().hits == 1
+        assert QueryCache._make_key("What is Python?") == QueryCache._make_key("what is  python?")
+
+    def test_no_fuzzy_match_by_default(self):
+        cache = QueryCache()
+        cache.set("what is python programming", "v")
+        assert cache.get("python programming what is") is None
+
+    def test_fuzzy_match_on_reordered_query(self):
+        pytest.importorskip("rapidfuzz")
+        cache = QueryCache(fuzzy_threshold=92)
+        cache.set("what is python programming", "v")
+        assert cache.get("python programming, what is") == "v"
+        assert cache.get("what is rust programming") is None
+
+    @pytest.mark.parametrize("stored, asked", [
+        ("python security vulnerabilities", "python"),   # asked is a subset
+        ("python", "python security vulnerabilities"),   # asked is a superset
+        ("what is python", "what is not python"),
+    ])
+    def test_fuzzy_match_rejects_different_questions(self, stored, asked):
+        pytest.importorskip("rapidfuzz")
+        cache = QueryCache(fuzzy_threshold=92)
+        cache.set(stored, "v")
+        assert cache.get(asked) is None
+
     def test_hit_rate(self):
         cache = QueryCache()
         cache.set("q", "v")
@@ -92,3 +161,80 @@ class TestQueryCache:
         assert "hit_rate" in stats
         assert "hits" in stats
         assert stats["max_size"] == 10
+
+
+class TestSemanticQueryCache:
+
+    @staticmethod
+    def embed(text):
+        """Toy encoder: counts of a tiny vocabulary, synonyms folded together."""
+        vocab = {"python": 0, "language": 1, "rust": 2, "creator": 3, "author": 3}
+        vec = [0.0] * 4
+        for word in text.replace("?", "").split():
+            if word in vocab:
+                vec[vocab[word]] += 1
+        return vec
+
+    def test_paraphrase_hits(self):
+        cache = SemanticQueryCache(self.embed, similarity_threshold=0.9)
+        cache.set("Who is the creator of Python?", "Guido")
+        assert cache.get("python author") == "Guido"
+        assert cache.stats()["hits"] == 1
+
+    def test_dissimilar_query_misses(self):
+        cache = SemanticQueryCache(self.embed, similarity_threshold=0.9)
+        cache.set("python language", "v")
+        assert cache.get("rust language") is None
+
+    def test_evicted_keys_are_not_served(self):
+        cache = SemanticQueryCache(self.embed, similarity_threshold=0.9, max_size=1)
+        cache.set("python creator", "Guido")
+        cache.set("rust language", "v")  # evicts the python entry
+        assert cache.get("python author") is None
+
+    def test_expired_best_match_does_not_shadow_live_one(self):
+        clock = FakeClock()
+        cache = SemanticQueryCache(self.embed, similarity_threshold=0.8, ttl_seconds=10, clock=clock)
+        cache.set("python creator", "stale")
+        clock.t = 5
+        cache.set("python language creator", "live")
+        clock.t = 12  # first entry expired but not yet purged
+        assert cache.get("python author") == "live"
+
+
+class TestDiskCache:
+
+    def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "nested" / "wiki.sqlite3")
+        cache = DiskCache(path, ttl_seconds=60)
+        cache.set("What is Python?", {"content": "A language"})
+        cache.close()
+
+        reopened = DiskCache(path, ttl_seconds=60)
+        assert reopened.get("what is  python?") == {"content": "A language"}
+        reopened.close()
+
+    def test_expired_entries_dropped(self, tmp_path):
+        clock = FakeClock()
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), ttl_seconds=10, clock=clock)
+        cache.set("q", "v")
+        clock.t = 11
+        assert cache.get("q") is None
+        assert cache.size == 0
+        cache.close()
+
+    def test_database_errors_read_as_misses(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), ttl_seconds=60)
+        cache.set("q", "v")
+        cache._db.execute("DROP TABLE entries")  # stands in for a locked/corrupt file
+        assert cache.get("q") is None
+        assert cache.invalidate("q") is False
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_usable_from_worker_threads(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), ttl_seconds=60)
+        await asyncio.gather(*(asyncio.to_thread(cache.set, f"q{i}", i) for i in range(8)))
+        assert await asyncio.to_thread(cache.get, "q3") == 3
+        assert cache._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        cache.close()
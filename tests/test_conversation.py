@@ -35,6 +35,12 @@ class TestSession:
         # Should only contain the last 2 turns
         assert "q9" in ctx or "a9" in ctx
 
+    def test_positional_turns(self):
+        s = Session("s1", [Turn(role="user", content="Hello")])
+        assert s.num_turns == 1
+        assert s.max_turns is None
+        assert "User: Hello" in s.build_context()
+
 
 class TestConversationBuffer:
 
@@ -83,6 +89,22 @@ class TestConversationBuffer:
         # After trimming, turns should be <= max_turns_per_session
         assert session.num_turns <= 4
 
+    def test_max_turns_keeps_most_recent(self):
+        buf = ConversationBuffer(max_turns_per_session=4)
+        for i in range(10):
+            buf.add_user_turn("s", f"q{i}")
+        session = buf.get_or_create("s")
+        assert [t.content for t in session.turns] == ["q6", "q7", "q8", "q9"]
+
+    def test_lru_access_refreshes_session(self):
+        buf = ConversationBuffer(max_sessions=2)
+        buf.add_user_turn("s1", "q")
+        buf.add_user_turn("s2", "q")
+        buf.add_user_turn("s1", "again")  # s1 becomes most recent
+        buf.add_user_turn("s3", "q")      # should evict s2
+        assert buf.session_info("s1") is not None
+        assert buf.session_info("s2") is None
+
     def test_active_sessions_count(self):
         buf = ConversationBuffer()
         assert buf.active_sessions == 0
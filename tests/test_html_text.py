@@ -0,0 +1,27 @@
+"""
+Tests for HTML → text extraction
+"""
+from velocity.network.html_text import extract_text
+
+
+class TestExtractText:
+
+    def test_drops_scripts_and_keeps_tail_text(self):
+        html = "<html><body><p>Hello <b>world</b></p><script>var x</script>after</body></html>"
+        assert extract_text(html) == "Hello world after"
+
+    def test_custom_drop_tags(self):
+        html = "<body><nav>Home | About</nav><p>Content here</p></body>"
+        assert extract_text(html, drop_tags=("nav",)) == "Content here"
+
+    def test_bytes_with_encoding(self):
+        html = "<p>Türkçe metin</p>".encode("iso-8859-9")
+        assert extract_text(html, encoding="iso-8859-9") == "Türkçe metin"
+
+    def test_xml_declaration_in_text(self):
+        html = '<?xml version="1.0" encoding="utf-8"?><html><body><p>ok</p></body></html>'
+        assert extract_text(html) == "ok"
+
+    def test_empty_document(self):
+        assert extract_text("") == ""
+        assert extract_text(b"   ") == ""
@@ -0,0 +1,189 @@
+"""
+Tests for NetworkInterrogator query fallbacks (network calls mocked)
+"""
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from velocity.network.interrogator import NetworkInterrogator, TokenBucket, _read_capped
+
+
+def _result(source, success=True):
+    return {"success": success, "query": "q", "source": source, "content": source}
+
+
+@pytest.fixture
+def interrogator():
+    return NetworkInterrogator(use_real_search=False)
+
+
+class TestExecuteQuery:
+
+    @pytest.mark.asyncio
+    async def test_wikipedia_preferred_even_when_slower(self, interrogator):
+        async def wiki(query):
+            await asyncio.sleep(0.02)
+            return _result("wikipedia")
+
+        async def ddg(query):
+            return _result("duckduckgo")
+
+        with patch.object(interrogator, '_query_wikipedia_simple', side_effect=wiki), \
+             patch.object(interrogator, '_query_duckduckgo_instant', side_effect=ddg):
+            result = await interrogator._execute_query("q", "duckduckgo")
+        assert result["source"] == "wikipedia"
+
+    @pytest.mark.asyncio
+    async def test_wikipedia_miss_overlaps_duckduckgo(self, interrogator):
+        async def wiki(query):
+            await asyncio.sleep(0.05)
+            return _result("wikipedia", success=False)
+
+        async def ddg(query):
+            await asyncio.sleep(0.05)
+            return _result("duckduckgo")
+
+        loop = asyncio.get_running_loop()
+        with patch.object(interrogator, '_query_wikipedia_simple', side_effect=wiki), \
+             patch.object(interrogator, '_query_duckduckgo_instant', side_effect=ddg):
+            start = loop.time()
+            result = await interrogator._execute_query("q", "duckduckgo")
+            elapsed = loop.time() - start
+        assert result["source"] == "duckduckgo"
+        assert elapsed < 0.09  # concurrent, not 0.05 + 0.05
+
+    @pytest.mark.asyncio
+    async def test_both_failing_falls_back_to_simulated(self, interrogator):
+        with patch.object(interrogator, '_query_wikipedia_simple', side_effect=Exception("down")), \
+             patch.object(interrogator, '_query_duckduckgo_instant',
+                          return_value=_result("duckduckgo", success=False)), \
+             patch.object(interrogator, '_simulated_search_enhanced',
+                          return_value=_result("simulated")):
+            result = await interrogator._execute_query("q", "duckduckgo")
+        assert result["source"] == "simulated"
+
+
+class TestSearchParallel:
+
+    @pytest.mark.asyncio
+    async def test_all_queries_run_with_bounded_concurrency(self):
+        interrogator = NetworkInterrogator(max_parallel=2, use_real_search=False)
+        in_flight = peak = 0
+
+        async def execute(query, engine):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _result(query)
+
+        with patch.object(interrogator, '_execute_query', side_effect=execute):
+            results = await interrogator.search_parallel([f"q{i}" for i in range(7)])
+
+        assert [r["source"] for r in results] == [f"q{i}" for i in range(7)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_raising_cap_admits_waiting_queries(self):
+        interrogator = NetworkInterrogator(max_parallel=1, use_real_search=False)
+        in_flight = peak = 0
+        started = asyncio.Event()
+
+        async def execute(query, engine):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            started.set()
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return _result(query)
+
+        with patch.object(interrogator, '_execute_query', side_effect=execute):
+            search = asyncio.create_task(
+                interrogator.search_parallel([f"q{i}" for i in range(4)])
+            )
+            await started.wait()
+            await interrogator.set_max_parallel(4)
+            results = await search
+
+        assert len(results) == 4
+        assert peak == 4
+
+
+class TestSimulatedSearch:
+
+    @pytest.mark.asyncio
+    async def test_knowledge_base_exact_and_substring(self, interrogator):
+        with patch('velocity.network.interrogator.asyncio.sleep'):
+            exact = await interrogator._simulated_search_enhanced("Blockchain")
+            partial = await interrogator._simulated_search_enhanced("tell me about rust")
+        assert exact["metadata"]["matched_key"] == "blockchain"
+        assert partial["metadata"]["matched_key"] == "rust"
+
+
+class TestWikipediaDiskCache:
+
+    @pytest.mark.asyncio
+    async def test_disk_hit_skips_network(self, tmp_path):
+        first = NetworkInterrogator(use_real_search=False, cache_dir=str(tmp_path))
+        first._wikipedia_disk.set("Python", _result("wikipedia:Python"))
+        await first.close()
+
+        second = NetworkInterrogator(use_real_search=False, cache_dir=str(tmp_path))
+        result = await second._query_wikipedia_simple("answer: Python")
+        assert result["source"] == "wikipedia:Python"
+        assert result["query"] == "answer: Python"
+        await second.close()
+
+
+class TestTokenBucket:
+
+    @staticmethod
+    def _fake_time():
+        """Clock plus an asyncio.sleep stand-in that advances it."""
+        now = [0.0]
+        slept = []
+
+        async def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        return (lambda: now[0]), sleep, slept
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        clock, sleep, slept = self._fake_time()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+        with patch('velocity.network.interrogator.asyncio.sleep', side_effect=sleep):
+            for _ in range(4):
+                await bucket.acquire()
+        assert slept == [pytest.approx(0.5)]  # three free, the fourth waits 1/rate
+
+    @pytest.mark.asyncio
+    async def test_block_for_delays_next_request(self):
+        clock, sleep, slept = self._fake_time()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+        bucket.block_for(5.0)
+        with patch('velocity.network.interrogator.asyncio.sleep', side_effect=sleep):
+            await bucket.acquire()
+        assert clock() == pytest.approx(5.5)  # Retry-After, then one token's refill
+
+
+class TestReadCapped:
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_limit(self):
+        pulled = []
+
+        async def iter_chunked(size):
+            for i in range(100):
+                pulled.append(i)
+                yield b"x" * size
+
+        response = MagicMock()
+        response.content.iter_chunked = iter_chunked
+        body = await _read_capped(response, 40_000)
+        assert len(body) == 40_000
+        assert len(pulled) == 3  # 3 x 16 KiB covers the limit
@@ -0,0 +1,334 @@
+"""
+Tests for LLMSynthesizer (providers mocked)
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+
+from velocity.synthesis import llm_synthesizer
+from velocity.synthesis.llm_synthesizer import LLMProvider, LLMSynthesizer, SynthesisConfig
+
+
+@pytest_asyncio.fixture
+async def synthesizer():
+    synthesizer = LLMSynthesizer(SynthesisConfig())
+    yield synthesizer
+    await synthesizer.close()
+
+
+class TestSynthesisCache:
+
+    @pytest.mark.asyncio
+    async def test_repeat_synthesis_served_from_cache(self, synthesizer):
+        with patch.object(synthesizer, "_synthesize_ollama",
+                          AsyncMock(return_value="Python is a language.")) as call:
+            first = await synthesizer.synthesize("facts", ["a.org"], "What is Python?")
+            first["natural_answer"] = "mutated"
+            second = await synthesizer.synthesize("facts", ["a.org"], "what is  python?")
+        assert call.await_count == 1
+        assert second["natural_answer"] == "Python is a language."
+
+    @pytest.mark.asyncio
+    async def test_different_facts_or_model_miss(self, synthesizer):
+        with patch.object(synthesizer, "_synthesize_ollama",
+                          AsyncMock(return_value="answer")) as call:
+            await synthesizer.synthesize("facts", [], "q")
+            await synthesizer.synthesize("other facts", [], "q")
+            synthesizer.config.model = "llama3:8b"
+            await synthesizer.synthesize("facts", [], "q")
+        assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_fallback_not_cached(self, synthesizer):
+        failing = AsyncMock(side_effect=RuntimeError("down"))
+        with patch.object(synthesizer, "_synthesize_ollama", failing):
+            result = await synthesizer.synthesize("facts", [], "q")
+            await synthesizer.synthesize("facts", [], "q")
+        assert result["fallback"] is True
+        assert failing.await_count == 2
+
+
+def _ollama_stream_client(lines):
+    """httpx client whose Ollama endpoint answers with NDJSON ``lines``."""
+    def handler(request):
+        body = "".join(json.dumps(line) + "\n" for line in lines)
+        return httpx.Response(200, content=body.encode())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestSynthesizeStream:
+
+    @pytest.mark.asyncio
+    async def test_tokens_yielded_in_order(self):
+        client = _ollama_stream_client([
+            {"response": "Python ", "done": False},
+            {"response": "is a language.", "done": False},
+            {"response": "", "done": True},
+            {"response": "ignored", "done": False},
+        ])
+        synthesizer = LLMSynthesizer(SynthesisConfig(), client=client)
+        tokens = [t async for t in synthesizer.synthesize_stream("facts", [], "q")]
+        assert tokens == ["Python ", "is a language."]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_falls_back_to_raw(self):
+        client = _ollama_stream_client([{"response": "", "done": True}])
+        synthesizer = LLMSynthesizer(SynthesisConfig(), client=client)
+        tokens = [t async for t in synthesizer.synthesize_stream("raw facts", [], "q")]
+        assert tokens == ["raw facts"]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cloud_provider_tokens_streamed(self):
+        body = (b'data: {"choices": [{"delta": {"content": "Guido "}}]}\n\n'
+                b'data: {"choices": [{"delta": {"content": "van Rossum."}}]}\n\n'
+                b'data: [DONE]\n\n')
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body)
+        ))
+        config = SynthesisConfig(provider=LLMProvider.GROQ, groq_api_key="key")
+        synthesizer = LLMSynthesizer(config, client=client)
+        tokens = [t async for t in synthesizer.synthesize_stream("facts", [], "q")]
+        assert tokens == ["Guido ", "van Rossum."]
+        await client.aclose()
+
+
+class TestSynthesisPrompt:
+
+    def test_prompts_share_fixed_prefix(self, synthesizer):
+        a = synthesizer._build_synthesis_prompt("facts one", [], "What is Python?", "auto")
+        b = synthesizer._build_synthesis_prompt("facts two", [], "Rust dili neden güvenli?", "auto")
+        prefix = a[:len(a) - len(a.split("Write in", 1)[1])]
+        assert b.startswith(prefix)
+        assert "Write in English." in a
+        assert "Write in the same language as the query." in b
+
+
+class TestInFlightCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self, synthesizer):
+        async def slow(*args):
+            await asyncio.sleep(0.01)
+            return "shared answer"
+
+        with patch.object(synthesizer, "_synthesize_ollama", AsyncMock(side_effect=slow)) as call:
+            results = await asyncio.gather(*[
+                synthesizer.synthesize("facts", [], "q") for _ in range(5)
+            ])
+        assert call.await_count == 1
+        assert all(r["natural_answer"] == "shared answer" for r in results)
+        assert not synthesizer._in_flight
+
+    @pytest.mark.asyncio
+    async def test_shared_failure_falls_back_for_every_waiter(self, synthesizer):
+        async def failing(*args):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        with patch.object(synthesizer, "_synthesize_ollama", AsyncMock(side_effect=failing)) as call:
+            results = await asyncio.gather(*[
+                synthesizer.synthesize("facts", [], "q") for _ in range(3)
+            ])
+        assert call.await_count == 1
+        assert all(r["fallback"] for r in results)
+
+
+class TestClose:
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self):
+        async with LLMSynthesizer(SynthesisConfig()) as synthesizer:
+            pass
+        assert synthesizer.client.is_closed
+        await synthesizer.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_left_open(self):
+        client = httpx.AsyncClient()
+        async with LLMSynthesizer(SynthesisConfig(), client=client):
+            pass
+        assert not client.is_closed
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unclosed_synthesizer_warns_when_collected(self):
+        synthesizer = LLMSynthesizer(SynthesisConfig())
+        with patch.object(llm_synthesizer.logger, "warning") as warning:
+            synthesizer._finalizer()
+        warning.assert_called_once_with(
+            "LLMSynthesizer was not closed; its HTTP connections leak until exit"
+        )
+        await synthesizer.client.aclose()
+
+
+class TestSemanticSynthesisCache:
+
+    @staticmethod
+    def embed(text):
+        # "creator" and "author" share an axis, so those queries are paraphrases
+        return [float("python" in text),
+                float("creator" in text or "author" in text),
+                float("rust" in text)]
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_served_from_semantic_tier(self):
+        synthesizer = LLMSynthesizer(SynthesisConfig(), embed=self.embed)
+        with patch.object(synthesizer, "_synthesize_ollama",
+                          AsyncMock(return_value="Guido van Rossum.")) as call:
+            first = await synthesizer.synthesize("facts a", [], "python creator")
+            second = await synthesizer.synthesize("facts a", [], "python author")
+            third = await synthesizer.synthesize("facts a", [], "rust")
+        assert call.await_count == 2
+        assert first["cached"] is False
+        assert second["cached"] is True and second["natural_answer"] == "Guido van Rossum."
+        assert third["cached"] is False
+        await synthesizer.close()
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_requires_same_settings(self):
+        synthesizer = LLMSynthesizer(SynthesisConfig(), embed=self.embed)
+        with patch.object(synthesizer, "_synthesize_ollama",
+                          AsyncMock(return_value="answer")) as call:
+            await synthesizer.synthesize("facts a", [], "python creator")
+            synthesizer.config.model = "llama3:8b"
+            await synthesizer.synthesize("facts a", [], "python author")
+        assert call.await_count == 2
+        await synthesizer.close()
+
+    @pytest.mark.asyncio
+    async def test_same_query_with_new_facts_misses(self):
+        synthesizer = LLMSynthesizer(SynthesisConfig(), embed=self.embed)
+        provider = AsyncMock(side_effect=["Python 3.12 (2023).", "Python 3.13 (2024)."])
+        with patch.object(synthesizer, "_synthesize_ollama", provider):
+            await synthesizer.synthesize("3.12 released in 2023", [], "latest python")
+            second = await synthesizer.synthesize("3.13 released in 2024", [], "latest python")
+            third = await synthesizer.synthesize("3.13 released in 2024", [], "python latest")
+        assert provider.await_count == 2
+        assert second["cached"] is False
+        assert second["natural_answer"] == "Python 3.13 (2024)."
+        assert third["cached"] is True and third["natural_answer"] == "Python 3.13 (2024)."
+        await synthesizer.close()
+
+
+class TestHTTPClient:
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_reach_the_transport(self):
+        with patch("httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport) as transport:
+            async with LLMSynthesizer(SynthesisConfig(max_connections=7, max_keepalive=3)):
+                pass
+        limits = transport.call_args.kwargs["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections) == (7, 3)
+
+
+class TestSynthesizeMany:
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_bounded_concurrency(self):
+        synthesizer = LLMSynthesizer(SynthesisConfig(max_concurrency=2))
+        in_flight = peak = 0
+
+        async def provider(raw_facts, sources, query, language):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"answer {query}"
+
+        items = [{"raw_facts": f"facts {i}", "sources": [], "query": f"q{i}"} for i in range(5)]
+        with patch.object(synthesizer, "_synthesize_ollama", side_effect=provider):
+            results = await synthesizer.synthesize_many(items)
+        assert [r["natural_answer"] for r in results] == [f"answer q{i}" for i in range(5)]
+        assert peak == 2
+        await synthesizer.close()
+
+
+class TestDirectPath:
+
+    @pytest.mark.asyncio
+    async def test_finished_prose_skips_provider(self, synthesizer):
+        with patch.object(synthesizer, "_synthesize_ollama", AsyncMock(return_value="x")) as call:
+            result = await synthesizer.synthesize(
+                "Paris is the capital of France.", [], "capital of france"
+            )
+        assert call.await_count == 0
+        assert result["provider"] == "direct"
+        assert result["natural_answer"] == "Paris is the capital of France."
+        assert synthesizer.direct_answers == 1
+
+    @pytest.mark.parametrize("facts, query", [
+        ("Paris is the capital of France.", "Fransa'nın başkenti neresi?"),
+        ("Python is a language. It is old. It is popular.", "python"),
+        ("- name: Python\n- year: 1991", "python"),
+    ])
+    def test_rewrite_still_needed(self, facts, query):
+        assert not LLMSynthesizer._should_skip_llm(facts, query, "auto")
+
+
+class TestStreamFraming:
+
+    @pytest.mark.asyncio
+    async def test_sse_lines_split_across_chunks(self):
+        body = [b'data: {"choices": [{"delta": {"content": "Hel"}}]}\r\n\r\ndata: {"choi',
+                b'ces": [{"delta": {"content": "lo there"}}]}\n\ndata: [DONE]\n']
+
+        async def stream():
+            for part in body:
+                yield part
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=stream())
+        ))
+        synthesizer = LLMSynthesizer(SynthesisConfig(), client=client)
+        text = await synthesizer._stream_openai_compatible("http://llm/v1", {}, {})
+        assert text == "Hello there"
+        await client.aclose()
+
+
+def _status_error(code):
+    request = httpx.Request("POST", "http://llm")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(code, request=request))
+
+
+class TestRetryAndCircuitBreaker:
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self):
+        with patch.object(llm_synthesizer, "RETRY_WAIT_MIN", 0), \
+             patch.object(llm_synthesizer, "RETRY_WAIT_MAX", 0):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_retried(self, synthesizer):
+        provider = AsyncMock(side_effect=[_status_error(503), _status_error(429), "answer"])
+        with patch.object(synthesizer, "_synthesize_ollama", provider):
+            result = await synthesizer.synthesize("facts", [], "q")
+        assert result["natural_answer"] == "answer"
+        assert provider.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, synthesizer):
+        provider = AsyncMock(side_effect=_status_error(401))
+        with patch.object(synthesizer, "_synthesize_ollama", provider):
+            result = await synthesizer.synthesize("facts", [], "q")
+        assert result["fallback"] is True
+        assert provider.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_failures(self):
+        synthesizer = LLMSynthesizer(SynthesisConfig(max_retries=0, circuit_failures=2))
+        provider = AsyncMock(side_effect=_status_error(500))
+        with patch.object(synthesizer, "_synthesize_ollama", provider):
+            for i in range(4):
+                result = await synthesizer.synthesize(f"facts {i}", [], "q")
+                assert result["fallback"] is True
+        assert provider.await_count == 2  # the last two never reached the provider
+        await synthesizer.close()
@@ -1,6 +1,7 @@
 """
 Tests for WebSearchEngine (async, uses httpx)
 """
+import httpx
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -59,6 +60,29 @@ class TestWebSearchEngine:
             results = await engine.search("test query")
             assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_dropped_and_fetch_failure_isolated(self, engine):
+        """Repeated URLs are fetched once; one failing fetch keeps the others."""
+        with patch.object(engine, '_search_duckduckgo_html', new_callable=AsyncMock) as mock_ddg:
+            mock_ddg.return_value = [
+                SearchResult(url="https://a.com", title="A", snippet=""),
+                SearchResult(url="https://a.com", title="A again", snippet=""),
+                SearchResult(url="https://b.com", title="B", snippet=""),
+            ]
+
+            async def fetch(url):
+                if url == "https://b.com":
+                    raise Exception("timeout")
+                return f"content of {url}"
+
+            with patch.object(engine, '_fetch_content', side_effect=fetch) as mock_fetch:
+                results = await engine.search("test")
+
+        assert [r.url for r in results] == ["https://a.com", "https://b.com"]
+        assert results[0].content == "content of https://a.com"
+        assert results[1].content is None
+        assert mock_fetch.call_count == 2
+
     @pytest.mark.asyncio
     async def test_close_client(self, engine):
         """close() should not raise even if client was never used."""
@@ -69,3 +93,13 @@ class TestWebSearchEngine:
         assert engine._client is None
         _ = engine.client  # access property
         assert engine._client is not None
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_reach_the_transport(self, engine):
+        """The keep-alive limits must be set on the transport, which owns the pool."""
+        with patch("httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport) as transport:
+            _ = engine.client
+        await engine.close()
+        limits = transport.call_args.kwargs["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections) == (100, 32)
+        assert limits.keepalive_expiry == 60
@@ -15,20 +15,47 @@ Algoritmik Çekirdek:
 7. State Synthesis - Final kararı oluştur
 """
 
-# New Core (Algorithmic Kernel)
-from .core.velocity_core import VelocityCore
-from .core.intent_parser import IntentParser, IntentGraph
-from .core.epistemic_router import EpistemicRouter, SourceStrategy
-from .core.hypothesis_generator import HypothesisGenerator, Hypothesis
-from .core.interrogation_loop import InterrogationLoop, ParallelInterrogationEngine
-from .core.hypothesis_eliminator import HypothesisEliminator, EliminationCriteria
-from .core.state_synthesizer import StateSynthesizer, SynthesizedState
-
-# Legacy (for compatibility)
-from .core.engine import VelocityEngine
-from .core.state import CognitiveState
-from .network.interrogator import NetworkInterrogator
-from .evaluation.hypothesis import HypothesisEvaluator
+import importlib
+
+# Public names and the submodules that define them. They are imported on
+# first attribute access (PEP 562), so `import velocity.core.cache` does
+# not drag in the network and synthesis stacks.
+_EXPORTS = {
+    # New Core (Algorithmic Kernel)
+    "VelocityCore": ".core.velocity_core",
+    "IntentParser": ".core.intent_parser",
+    "IntentGraph": ".core.intent_parser",
+    "EpistemicRouter": ".core.epistemic_router",
+    "SourceStrategy": ".core.epistemic_router",
+    "HypothesisGenerator": ".core.hypothesis_generator",
+    "Hypothesis": ".core.hypothesis_generator",
+    "InterrogationLoop": ".core.interrogation_loop",
+    "ParallelInterrogationEngine": ".core.interrogation_loop",
+    "HypothesisEliminator": ".core.hypothesis_eliminator",
+    "EliminationCriteria": ".core.hypothesis_eliminator",
+    "StateSynthesizer": ".core.state_synthesizer",
+    "SynthesizedState": ".core.state_synthesizer",
+
+    # Legacy (for compatibility)
+    "VelocityEngine": ".core.engine",
+    "CognitiveState": ".core.state",
+    "NetworkInterrogator": ".network.interrogator",
+    "HypothesisEvaluator": ".evaluation.hypothesis",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __version__ = "0.2.0"  # Algorithmic Core
 __all__ = [
@@ -1,12 +1,36 @@
 """Core components of the Velocity engine."""
 
-from .engine import VelocityEngine
-from .state import CognitiveState
-from .cache import QueryCache
-from .conversation import ConversationBuffer
-from .nlp_engine import AnswerEngine, StructuredAnswer, render_answer
+import importlib
+
+# Imported on first attribute access (PEP 562): the lightweight modules
+# (cache, conversation) stay importable without the network stack.
+_EXPORTS = {
+    "VelocityEngine": ".engine",
+    "CognitiveState": ".state",
+    "QueryCache": ".cache",
+    "SemanticQueryCache": ".semantic_cache",
+    "DiskCache": ".disk_cache",
+    "ConversationBuffer": ".conversation",
+    "AnswerEngine": ".nlp_engine",
+    "StructuredAnswer": ".nlp_engine",
+    "render_answer": ".nlp_engine",
+}
 
 __all__ = [
-    "VelocityEngine", "CognitiveState", "QueryCache", "ConversationBuffer",
+    "VelocityEngine", "CognitiveState", "QueryCache", "SemanticQueryCache",
+    "DiskCache", "ConversationBuffer",
     "AnswerEngine", "StructuredAnswer", "render_answer",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
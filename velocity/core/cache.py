@@ -7,12 +7,19 @@ Intelligence isn't just speed of acquisition — it's also knowing
 when you've already acquired it.
 """
 
-import hashlib
+import functools
+import heapq
+import math
 import time
 from collections import OrderedDict
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from loguru import logger
 
+try:  # Optional: near-match lookups (pip install velocity-nnei[fuzzy])
+    from rapidfuzz import fuzz as _fuzz, process as _fuzz_process
+except ImportError:  # pragma: no cover - depends on environment
+    _fuzz = _fuzz_process = None
+
 
 class QueryCache:
     """
@@ -20,9 +27,13 @@ class QueryCache:
 
     Key design choices:
     - LRU eviction: least recently used entries are dropped when full.
-    - TTL per entry: stale results are automatically invalidated.
+    - TTL per entry: stale results are automatically invalidated, and a
+      min-heap of deadlines lets ``set`` drop expired entries before it
+      has to evict a live one.
     - Fuzzy key matching: normalises whitespace/case before hashing so
       "Python vs JS" and "python vs js " hit the same cached entry.
+    - Optional near-match lookup: with ``fuzzy_threshold`` set and RapidFuzz
+      installed, an exact miss falls back to the most similar stored key.
 
     Usage::
 
@@ -38,16 +49,29 @@ class QueryCache:
         self,
         max_size: int = 256,
         ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        fuzzy_threshold: float = 0.0,
     ) -> None:
         """
         Args:
             max_size:    Maximum number of cached entries before LRU eviction.
             ttl_seconds: Time-to-live in seconds.  0 = never expire.
+            clock:       Monotonic time source (injectable for tests).
+            fuzzy_threshold: Minimum token-sort similarity (0-100) for a
+                         near-match hit.  0 = exact keys only.
         """
         self.max_size = max_size
         self.ttl = ttl_seconds
-        # OrderedDict preserves insertion/access order for LRU semantics
+        self._clock = clock
+        self.fuzzy_threshold = fuzzy_threshold
+        if fuzzy_threshold and _fuzz_process is None:
+            logger.warning("rapidfuzz not installed; QueryCache uses exact keys only")
+        # OrderedDict preserves insertion/access order for LRU semantics;
+        # each entry carries its absolute monotonic expiry deadline
         self._store: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        # (deadline, key) min-heap; entries whose deadline no longer matches
+        # the stored one are stale and skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._hits = 0
         self._misses = 0
 
@@ -60,14 +84,21 @@ class QueryCache:
         key = self._make_key(query)
         entry = self._store.get(key)
 
+        # Exact keys first; near-match scan only on a miss
+        if entry is None:
+            near = self._near_key(key)
+            if near is not None:
+                key, entry = near, self._store[near]
+                logger.debug(f"Cache NEAR: {query[:60]}")
+
         if entry is None:
             self._misses += 1
             return None
 
-        value, timestamp = entry
+        value, deadline = entry
 
-        # TTL check
-        if self.ttl > 0 and (time.monotonic() - timestamp) > self.ttl:
+        # TTL check (deadline is inf when entries never expire)
+        if self._clock() > deadline:
             logger.debug(f"Cache EXPIRED: {query[:60]}")
             del self._store[key]
             self._misses += 1
@@ -85,7 +116,12 @@ class QueryCache:
 
         if key in self._store:
             self._store.move_to_end(key)
-        self._store[key] = (value, time.monotonic())
+        now = self._clock()
+        deadline = now + self.ttl if self.ttl > 0 else math.inf
+        self._store[key] = (value, deadline)
+        if self.ttl > 0:
+            heapq.heappush(self._expiry_heap, (deadline, key))
+            self._purge_expired(now)
 
         # Evict oldest entry if over capacity
         if len(self._store) > self.max_size:
@@ -105,6 +141,7 @@ class QueryCache:
     def clear(self) -> None:
         """Remove all cached entries and reset statistics."""
         self._store.clear()
+        self._expiry_heap.clear()
         self._hits = 0
         self._misses = 0
         logger.info("Cache cleared")
@@ -127,6 +164,7 @@ class QueryCache:
             "size": self.size,
             "max_size": self.max_size,
             "ttl_seconds": self.ttl,
+            "fuzzy_threshold": self.fuzzy_threshold,
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": round(self.hit_rate, 3),
@@ -136,8 +174,46 @@ class QueryCache:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _purge_expired(self, now: float) -> None:
+        """Drop every entry whose deadline has passed, earliest first."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            deadline, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == deadline:
+                del self._store[key]
+                logger.debug(f"Cache EVICT (TTL): {key[:16]}…")
+
+        # Refreshed, invalidated and LRU-evicted keys leave stale heap items
+        # behind; rebuild from the live store before they pile up
+        if len(heap) > 2 * self.max_size:
+            self._expiry_heap = [(d, k) for k, (_, d) in self._store.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _near_key(self, key: str) -> Optional[str]:
+        """Stored key to serve for an exact miss on ``key``, if any."""
+        return self._fuzzy_key(key) if self.fuzzy_threshold else None
+
+    def _fuzzy_key(self, key: str) -> Optional[str]:
+        """Return the stored key most similar to ``key``, if close enough."""
+        if _fuzz_process is None or not self._store:
+            return None
+        match = _fuzz_process.extractOne(
+            key,
+            self._store.keys(),
+            scorer=_fuzz.token_sort_ratio,
+            score_cutoff=self.fuzzy_threshold,
+        )
+        return match[0] if match else None
+
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _make_key(query: str) -> str:
-        """Normalise and hash the query to a stable cache key."""
-        normalised = " ".join(query.lower().split())
-        return hashlib.sha256(normalised.encode()).hexdigest()
+        """
+        Normalise the query to a stable cache key.
+
+        The key never leaves the process, so the normalised string itself is
+        the key and the dict's own hashing does the rest. Memoised: a repeated
+        query string skips re-normalising.
+        """
+        return " ".join(query.lower().split())
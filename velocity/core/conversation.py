@@ -15,12 +15,13 @@ Architecture:
 from __future__ import annotations
 
 import time
-from collections import defaultdict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """A single conversation turn (user + assistant)."""
     role: str           # "user" | "assistant"
@@ -31,24 +32,40 @@ class Turn:
 
 @dataclass
 class Session:
-    """A conversation session identified by a unique session_id."""
+    """
+    A conversation session identified by a unique session_id.
+
+    When ``max_turns`` is set, the oldest turns fall off automatically
+    as new ones are added (a bounded deque, O(1) per turn).
+    """
     session_id: str
-    turns: List[Turn] = field(default_factory=list)
+    turns: Deque[Turn] = field(default_factory=deque)
     created_at: float = field(default_factory=time.time)
+    max_turns: Optional[int] = None
+    # "User: …" / "Assistant: …" context lines, formatted once per turn
+    _lines: Deque[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Callers may still hand in a plain list of turns
+        if not isinstance(self.turns, deque) or self.turns.maxlen != self.max_turns:
+            self.turns = deque(self.turns, maxlen=self.max_turns)
+        self._lines = deque(
+            (self._format(turn) for turn in self.turns), maxlen=self.max_turns
+        )
 
     # ------------------------------------------------------------------ #
     # Public helpers                                                       #
     # ------------------------------------------------------------------ #
 
     def add_user(self, content: str) -> None:
-        self.turns.append(Turn(role="user", content=content))
+        self._append(Turn(role="user", content=content))
 
     def add_assistant(self, content: str, confidence: Optional[float] = None) -> None:
-        self.turns.append(Turn(role="assistant", content=content, confidence=confidence))
+        self._append(Turn(role="assistant", content=content, confidence=confidence))
 
     def last_n(self, n: int) -> List[Turn]:
         """Return the last *n* turns (most recent first is preserved)."""
-        return self.turns[-n:]
+        return list(islice(self.turns, max(len(self.turns) - n, 0), None))
 
     def build_context(self, max_turns: int = 6) -> str:
         """
@@ -63,14 +80,12 @@ class Session:
             User: Who created it?
             Assistant: Guido van Rossum created Python...
         """
-        recent = self.last_n(max_turns)
-        if not recent:
+        start = max(len(self._lines) - max_turns, 0)
+        if start == len(self._lines):
             return ""
 
         lines = ["[Previous conversation]"]
-        for turn in recent:
-            role_label = "User" if turn.role == "user" else "Assistant"
-            lines.append(f"{role_label}: {turn.content}")
+        lines.extend(islice(self._lines, start, None))
         lines.append("")  # trailing newline for clean concatenation
         return "\n".join(lines)
 
@@ -78,6 +93,15 @@ class Session:
     def num_turns(self) -> int:
         return len(self.turns)
 
+    def _append(self, turn: Turn) -> None:
+        self.turns.append(turn)
+        self._lines.append(self._format(turn))
+
+    @staticmethod
+    def _format(turn: Turn) -> str:
+        role_label = "User" if turn.role == "user" else "Assistant"
+        return f"{role_label}: {turn.content}"
+
 
 class ConversationBuffer:
     """
@@ -111,8 +135,8 @@ class ConversationBuffer:
         self.max_sessions = max_sessions
         self.max_turns_per_session = max_turns_per_session
         self.context_window = context_window
-        self._sessions: Dict[str, Session] = {}
-        self._access_order: List[str] = []  # for LRU eviction
+        # Insertion order doubles as LRU order: most recently used last
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
 
     # ------------------------------------------------------------------ #
     # Session management                                                   #
@@ -120,33 +144,26 @@ class ConversationBuffer:
 
     def get_or_create(self, session_id: str) -> Session:
         """Return existing session or create a new one."""
-        if session_id not in self._sessions:
+        session = self._sessions.get(session_id)
+        if session is None:
             self._ensure_capacity()
-            self._sessions[session_id] = Session(session_id)
-
-        # Update LRU order
-        if session_id in self._access_order:
-            self._access_order.remove(session_id)
-        self._access_order.append(session_id)
-        return self._sessions[session_id]
+            session = Session(session_id, max_turns=self.max_turns_per_session)
+            self._sessions[session_id] = session
+        else:
+            # Update LRU order
+            self._sessions.move_to_end(session_id)
+        return session
 
     def delete_session(self, session_id: str) -> bool:
         """Explicitly delete a session. Returns True if it existed."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            if session_id in self._access_order:
-                self._access_order.remove(session_id)
-            return True
-        return False
+        return self._sessions.pop(session_id, None) is not None
 
     # ------------------------------------------------------------------ #
     # Turn recording                                                       #
     # ------------------------------------------------------------------ #
 
     def add_user_turn(self, session_id: str, content: str) -> None:
-        session = self.get_or_create(session_id)
-        session.add_user(content)
-        self._trim_session(session)
+        self.get_or_create(session_id).add_user(content)
 
     def add_assistant_turn(
         self,
@@ -154,9 +171,7 @@ class ConversationBuffer:
         content: str,
         confidence: Optional[float] = None,
     ) -> None:
-        session = self.get_or_create(session_id)
-        session.add_assistant(content, confidence)
-        self._trim_session(session)
+        self.get_or_create(session_id).add_assistant(content, confidence)
 
     # ------------------------------------------------------------------ #
     # Context enrichment                                                   #
@@ -202,13 +217,5 @@ class ConversationBuffer:
 
     def _ensure_capacity(self) -> None:
         """Evict oldest session if at capacity."""
-        while len(self._sessions) >= self.max_sessions and self._access_order:
-            oldest = self._access_order.pop(0)
-            self._sessions.pop(oldest, None)
-
-    def _trim_session(self, session: Session) -> None:
-        """Keep turns within max_turns_per_session to bound memory."""
-        if session.num_turns > self.max_turns_per_session:
-            # Drop oldest turns (keep the most recent half)
-            keep = self.max_turns_per_session // 2
-            session.turns = session.turns[-keep:]
+        while self._sessions and len(self._sessions) >= self.max_sessions:
+            self._sessions.popitem(last=False)
@@ -0,0 +1,39 @@
+"""
+Default Configuration - Shared Constructor Settings
+
+Demo'lar ve interaktif mod aynı ayarlarla çalışır; bu ayarlar tek yerde tutulur.
+
+The mappings are read-only so a caller cannot alter the defaults seen by
+every other entry point. Build fresh objects from them::
+
+    core = VelocityCore(
+        **DEFAULT_CORE_KWARGS,
+        llm_config=SynthesisConfig(**DEFAULT_LLM_KWARGS),
+    )
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from ..synthesis.llm_synthesizer import LLMProvider
+
+
+# Light interrogation budget for interactive use: two hypotheses,
+# stop at 60% confidence, at most three rounds each.
+DEFAULT_CORE_KWARGS: Mapping[str, Any] = MappingProxyType({
+    "max_hypotheses": 2,
+    "confidence_threshold": 0.6,
+    "max_iterations": 3,
+})
+
+# Local Qwen3 via Ollama, falling back to the raw NNEI answer.
+# Kept as kwargs rather than a SynthesisConfig instance because
+# LLMSynthesizer writes API keys into the config it is given.
+DEFAULT_LLM_KWARGS: Mapping[str, Any] = MappingProxyType({
+    "provider": LLMProvider.OLLAMA,
+    "model": "qwen3:8b",
+    "temperature": 0.3,
+    "max_tokens": 500,
+    "ollama_host": "http://localhost:11434",
+    "fallback_to_raw": True,
+})
@@ -0,0 +1,130 @@
+"""
+Disk Cache - Persistent TTL Store for Slow-Changing Lookups
+
+Süreç yeniden başladığında da önbellek sıcak kalır.
+
+A single SQLite file (stdlib only) holding JSON values, used behind the
+in-memory QueryCache for answers worth keeping across restarts, such as
+Wikipedia summaries.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from .cache import QueryCache
+
+
+class DiskCache:
+    """
+    Persistent key → JSON value store with a per-entry TTL.
+
+    Keys are normalised like QueryCache keys.  Deadlines are wall-clock
+    (``time.time``) because they must stay meaningful across processes.
+    Expired rows are dropped when read and swept on open.
+
+    Calls block on SQLite I/O, so async callers should run them in a worker
+    thread; the connection is shared across threads behind a lock, and WAL
+    with ``synchronous=NORMAL`` keeps each commit to a single write.
+
+    Usage::
+
+        cache = DiskCache("~/.cache/velocity/wikipedia.sqlite3", ttl_seconds=86400)
+
+        result = await asyncio.to_thread(cache.get, "Python")
+        if result is None:
+            result = await fetch_summary("Python")
+            await asyncio.to_thread(cache.set, "Python", result)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            path:        SQLite file; parent directories are created.
+            ttl_seconds: Time-to-live in seconds.  0 = never expire.
+            clock:       Wall-clock time source (injectable for tests).
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl_seconds
+        self._clock = clock
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, deadline REAL)"
+        )
+        self._db.execute(
+            "DELETE FROM entries WHERE deadline IS NOT NULL AND deadline < ?",
+            (self._clock(),),
+        )
+        self._db.commit()
+
+    def get(self, query: str) -> Optional[Any]:
+        """Return the stored value, or None if missing / expired."""
+        key = QueryCache._make_key(query)
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT value, deadline FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        value, deadline = row
+        if deadline is not None and self._clock() > deadline:
+            self.invalidate(query)
+            return None
+        return json.loads(value)
+
+    def set(self, query: str, value: Any) -> None:
+        """Store a JSON-serialisable value."""
+        key = QueryCache._make_key(query)
+        deadline = self._clock() + self.ttl if self.ttl > 0 else None
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, deadline) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), deadline),
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def invalidate(self, query: str) -> bool:
+        """Remove a single stored entry. Returns True if it existed."""
+        try:
+            with self._lock:
+                cursor = self._db.execute(
+                    "DELETE FROM entries WHERE key = ?", (QueryCache._make_key(query),)
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache delete failed: {e}")
+            return False
+        return cursor.rowcount > 0
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
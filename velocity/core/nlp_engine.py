@@ -16,9 +16,9 @@ from __future__ import annotations
 
 import re
 import math
-from collections import Counter, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
@@ -27,9 +27,9 @@ from loguru import logger
 # DATA CLASSES
 # ======================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Sentence:
-    """A scored, classified sentence."""
+    """A scored, classified sentence (slotted: one is built per sentence)."""
     text: str
     index: int                  # position in original document
     score: float = 0.0         # final composite score
@@ -40,9 +40,15 @@ class Sentence:
     is_definition: bool = False
     is_biographical: bool = False
     source: str = ""
+    # Lower-cased word set, filled by score_sentences for the dedup passes
+    tokens: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
 
+    def word_set(self) -> FrozenSet[str]:
+        """Lower-cased word set, computed here if score_sentences did not."""
+        return self.tokens or frozenset(self.text.lower().split())
 
-@dataclass
+
+@dataclass(slots=True)
 class Entity:
     """An extracted named entity with metadata."""
     name: str
@@ -64,17 +70,27 @@ class StructuredAnswer:
     raw_debug: Optional[str] = None       # cleaned combined text (for debugging)
 
 
+# Confidence bands, highest threshold first; below all of them is "Very Low"
+_CONFIDENCE_LEVELS: Tuple[Tuple[float, str], ...] = (
+    (0.8, "High"),
+    (0.55, "Moderate"),
+    (0.3, "Low"),
+)
+
+
 # ======================================================================
 # TEXT CLEANING — much more aggressive than the old _clean_evidence_text
 # ======================================================================
 
 # Patterns compiled once for speed
-_RE_URL = re.compile(r'https?://\S+|www\.\S+')
-_RE_REF = re.compile(r'\[\d+\]')
-_RE_CAMEL = re.compile(r'([a-z])([A-Z])')
-_RE_WORD_NUM = re.compile(r'([A-Za-z])(\d)')
-_RE_NUM_WORD = re.compile(r'(\d)([A-Za-z])')
-_RE_MULTI_SPACE = re.compile(r'[ \t]+')
+# URLs and [N] refs in one pass (a removed URL always ends at whitespace,
+# so it can never expose a new ref)
+_RE_URL_OR_REF = re.compile(r'https?://\S+|www\.\S+|\[\d+\]')
+# camelCase, word→digit and digit→word joints in one pass; zero-width so
+# "a1B" splits at both joints exactly like three sequential passes
+_RE_GLUED_JOINT = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Za-z])(?=\d)|(?<=\d)(?=[A-Za-z])')
+# Only runs and tabs: a lone space needs no rewrite
+_RE_MULTI_SPACE = re.compile(r'[ \t]{2,}|\t')
 _RE_MULTI_NEWLINE = re.compile(r'\n{3,}')
 _RE_PARENS_EMPTY = re.compile(r'\(\s*\)')
 _RE_NAVIGATION = re.compile(
@@ -89,6 +105,20 @@ _RE_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
 # Bullet / separator characters from web layouts
 _RE_BULLETS = re.compile(r'[·•|►▸▹▶‣⁃–—]+')
 
+# Lost word boundaries from HTML→text: "Researchingnon" → "Researching non".
+# Zero-width, so the regex engine never backtracks over the whole word
+_RE_GLUED_WORD = re.compile(
+    r'(?<=[a-zçğıöşü]{3})'
+    r'(?=(?:non|the|and|for|with|from|into|that|this|are|was|has|had|can|will|not)\b)',
+    re.I
+)
+
+# Punctuation spacing fixes
+_RE_PUNCT_SPACING = re.compile(r'\s*([,;:!?.])\s*')
+_RE_SPACE_BEFORE_DOT = re.compile(r'\s+\.')
+_RE_DOT_RUN = re.compile(r'\.{2,}')
+_RE_SPACED_DOTS = re.compile(r'\.\s*\.')
+
 # Common web "boilerplate" markers
 _BOILERPLATE_MARKERS = {
     'cookie', 'privacy', 'subscribe', 'newsletter', 'advertisement',
@@ -108,11 +138,8 @@ def deep_clean(text: str) -> str:
     if not text:
         return ""
 
-    # 1. Remove URLs
-    text = _RE_URL.sub('', text)
-
-    # 2. Remove reference markers
-    text = _RE_REF.sub('', text)
+    # 1-2. Remove URLs and reference markers
+    text = _RE_URL_OR_REF.sub('', text)
 
     # 3. Remove empty parens
     text = _RE_PARENS_EMPTY.sub('', text)
@@ -120,26 +147,23 @@ def deep_clean(text: str) -> str:
     # 4. Replace bullet/separator chars with period + space (they usually delimit items)
     text = _RE_BULLETS.sub('. ', text)
 
-    # 5. Fix camelCase concatenation
-    text = _RE_CAMEL.sub(r'\1 \2', text)
-    text = _RE_WORD_NUM.sub(r'\1 \2', text)
-    text = _RE_NUM_WORD.sub(r'\1 \2', text)
+    # 5. Fix camelCase / letter-digit concatenation
+    text = _RE_GLUED_JOINT.sub(' ', text)
 
     # 5b. Fix common concatenation patterns from web scraping:
     #     "Researchingnon" → "Researching non"  (lowercase touching lowercase where
     #     a word boundary was lost during HTML→text)
-    text = re.sub(r'([a-zçğıöşü]{3,})(non|the|and|for|with|from|into|that|this|are|was|has|had|can|will|not)\b',
-                  r'\1 \2', text, flags=re.I)
+    text = _RE_GLUED_WORD.sub(' ', text)
 
     # 6. Normalise whitespace
     text = _RE_MULTI_NEWLINE.sub('\n\n', text)
     text = _RE_MULTI_SPACE.sub(' ', text)
 
     # 7. Fix punctuation spacing
-    text = re.sub(r'\s*([,;:!?.])\s*', r'\1 ', text)
-    text = re.sub(r'\s+\.', '.', text)        # "word ." → "word."
-    text = re.sub(r'\.{2,}', '.', text)        # "..." clusters
-    text = re.sub(r'\.\s*\.', '.', text)       # ". ." → "."
+    text = _RE_PUNCT_SPACING.sub(r'\1 ', text)
+    text = _RE_SPACE_BEFORE_DOT.sub('.', text)   # "word ." → "word."
+    text = _RE_DOT_RUN.sub('.', text)            # "..." clusters
+    text = _RE_SPACED_DOTS.sub('.', text)        # ". ." → "."
 
     # 8. Remove lines that look like navigation / boilerplate
     cleaned_lines: list[str] = []
@@ -165,11 +189,20 @@ def deep_clean(text: str) -> str:
 # SENTENCE SEGMENTATION + SCORING
 # ======================================================================
 
+def _iter_raw_sentences(text: str) -> Iterator[str]:
+    """Yield the pieces of ``_RE_SENTENCE_SPLIT.split(text)`` one at a time."""
+    start = 0
+    for m in _RE_SENTENCE_SPLIT.finditer(text):
+        yield text[start:m.start()]
+        start = m.end()
+    yield text[start:]
+
+
 def segment_sentences(text: str) -> List[str]:
     """Split text into sentences, filtering garbage."""
-    raw = _RE_SENTENCE_SPLIT.split(text)
     out: list[str] = []
-    for s in raw:
+    # Streamed, so rejected fragments are never held in an intermediate list
+    for s in _iter_raw_sentences(text):
         s = s.strip()
         if len(s) < 20:                         # too short to be useful
             continue
@@ -187,17 +220,34 @@ def segment_sentences(text: str) -> List[str]:
     return out
 
 
-def _idf_weights(sentences: List[str]) -> Dict[str, float]:
-    """Compute IDF weights across sentences (mini-corpus)."""
-    n = len(sentences)
+# Definition / biographical cue words, matched per sentence
+_RE_DEFINITION = re.compile(
+    r'\b(is a|is an|is the|refers to|defined as|are|'
+    r'bir|olan|olarak|anlamına gelir|denir|demektir)\b',
+    re.I
+)
+_RE_BIOGRAPHICAL = re.compile(
+    r'\b(born|founded|created|developed|known for|career|researcher|'
+    r'author|architect|engineer|scientist|professor|CEO|developer|'
+    r'doğum|kurucu|geliştirici|bilinen|kariyer|araştırmacı|'
+    r'mühendis|yazar|bilim insanı|yazılımcı)\b',
+    re.I
+)
+
+
+def _idf_weights(token_sets: Sequence[FrozenSet[str]], terms: FrozenSet[str]) -> Dict[str, float]:
+    """
+    Compute IDF weights of ``terms`` across sentences (mini-corpus) from their
+    token sets.  Only the query's terms are ever looked up, so document
+    frequency is counted for those alone rather than the whole vocabulary.
+    """
+    n = len(token_sets)
     if n == 0:
         return {}
-    df: Counter = Counter()
-    for s in sentences:
-        words = set(s.lower().split())
-        for w in words:
-            df[w] += 1
-    return {w: math.log((n + 1) / (freq + 1)) + 1 for w, freq in df.items()}
+    return {
+        t: math.log((n + 1) / (sum(t in words for words in token_sets) + 1)) + 1
+        for t in terms
+    }
 
 
 def score_sentences(
@@ -218,15 +268,22 @@ def score_sentences(
     if not sentences:
         return []
 
-    idf = _idf_weights(sentences)
-    query_tokens = set(query.lower().split())
+    # Lower-case and tokenise each sentence once, for both IDF and scoring
+    lowered = [text.lower() for text in sentences]
+    token_lists = [text.split() for text in lowered]
+    token_sets = [frozenset(tokens) for tokens in token_lists]
+
+    query_tokens = frozenset(query.lower().split())
+    idf = _idf_weights(token_sets, query_tokens)
+    entities = [ent.lower() for ent in query_entities] if query_entities else []
 
     scored: List[Sentence] = []
     n = len(sentences)
 
     for idx, text in enumerate(sentences):
-        tokens = text.lower().split()
-        token_set = set(tokens)
+        lower_text = lowered[idx]
+        tokens = token_lists[idx]
+        token_set = token_sets[idx]
 
         # --- 1. Relevance ---
         overlap = query_tokens & token_set
@@ -250,24 +307,13 @@ def score_sentences(
 
         # --- 4. Entity match ---
         entity_score = 0.0
-        if query_entities:
-            for ent in query_entities:
-                if ent.lower() in text.lower():
-                    entity_score += 0.5
+        for ent in entities:
+            if ent in lower_text:
+                entity_score += 0.5
 
         # --- Definition / biographical signals ---
-        is_def = bool(re.search(
-            r'\b(is a|is an|is the|refers to|defined as|are|'
-            r'bir|olan|olarak|anlamına gelir|denir|demektir)\b',
-            text, re.I
-        ))
-        is_bio = bool(re.search(
-            r'\b(born|founded|created|developed|known for|career|researcher|'
-            r'author|architect|engineer|scientist|professor|CEO|developer|'
-            r'doğum|kurucu|geliştirici|bilinen|kariyer|araştırmacı|'
-            r'mühendis|yazar|bilim insanı|yazılımcı)\b',
-            text, re.I
-        ))
+        is_def = bool(_RE_DEFINITION.search(text))
+        is_bio = bool(_RE_BIOGRAPHICAL.search(text))
 
         # --- Composite ---
         # Weights tuneable: relevance dominates
@@ -290,6 +336,7 @@ def score_sentences(
             entity_score=entity_score,
             is_definition=is_def,
             is_biographical=is_bio,
+            tokens=token_set,
         ))
 
     # Sort by composite score DESC
@@ -333,6 +380,11 @@ _FIELD_PATTERNS = re.compile(
     re.IGNORECASE
 )
 
+# Two- or three-word capitalised names ("Ada Lovelace", "Alan Mathison Turing")
+_CAPITALISED_NAME = re.compile(
+    r'\b([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+){1,2})\b'
+)
+
 
 def extract_entities(text: str) -> List[Entity]:
     """Extract entities from text using regex heuristics."""
@@ -364,7 +416,7 @@ def extract_entities(text: str) -> List[Entity]:
             entities.append(Entity(name=name, category="TOPIC"))
 
     # Capitalised Name patterns (simple: 2-3 capitalised words)
-    for m in re.finditer(r'\b([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+){1,2})\b', text):
+    for m in _CAPITALISED_NAME.finditer(text):
         name = m.group(1)
         key = name.lower()
         if key not in seen and len(name) > 4:
@@ -398,7 +450,7 @@ def extract_key_facts(
     for sent in scored_sentences:
         if len(facts) >= max_facts:
             break
-        tokens = frozenset(sent.text.lower().split())
+        tokens = sent.word_set()
         # Simple dedup: reject if >60% token overlap with existing fact
         is_dup = False
         for existing in seen_tokens:
@@ -424,19 +476,27 @@ def extract_key_facts(
 # ANSWER COMPOSITION — query-type aware
 # ======================================================================
 
+# Query-type cues, checked in order against the lower-cased query
+_QUERY_TYPE_PATTERNS: Tuple[Tuple[re.Pattern, str], ...] = (
+    (re.compile(r'\b(kimdir|who is|who was|who are)\b'), 'biographical'),
+    (re.compile(r'\b(nedir|what is|what are|define|tanımla)\b'), 'definition'),
+    (re.compile(r'\bvs\b|\bcompare\b|\bkarşılaştır\b|\bfark\b|\bdifference\b'), 'comparative'),
+    (re.compile(r'\bhow to\b|\bnasıl\b|\bsteps\b|\badımlar\b'), 'procedural'),
+    (re.compile(r'\bwhy\b|\bneden\b|\bsebep\b'), 'causal'),
+)
+
+_RE_WHO_IS = re.compile(r'(?:who is|who was)\s+(.+)', re.I)
+_RE_KIMDIR = re.compile(r'(.+?)\s+kimdir', re.I)
+_RE_WHAT_IS = re.compile(r'(?:what is|what are)\s+(.+)', re.I)
+_RE_NEDIR = re.compile(r'(.+?)\s+nedir', re.I)
+
+
 def _detect_query_type(query: str) -> str:
     """Light-weight intent detection for answer shaping."""
     q = query.lower()
-    if re.search(r'\b(kimdir|who is|who was|who are)\b', q):
-        return 'biographical'
-    if re.search(r'\b(nedir|what is|what are|define|tanımla)\b', q):
-        return 'definition'
-    if re.search(r'\bvs\b|\bcompare\b|\bkarşılaştır\b|\bfark\b|\bdifference\b', q):
-        return 'comparative'
-    if re.search(r'\bhow to\b|\bnasıl\b|\bsteps\b|\badımlar\b', q):
-        return 'procedural'
-    if re.search(r'\bwhy\b|\bneden\b|\bsebep\b', q):
-        return 'causal'
+    for pattern, query_type in _QUERY_TYPE_PATTERNS:
+        if pattern.search(q):
+            return query_type
     return 'general'
 
 
@@ -444,17 +504,17 @@ def _query_subject(query: str) -> str:
     """Best-effort extract of the main subject from the query."""
     q = query.strip()
     # "who is X" / "X kimdir"
-    m = re.search(r'(?:who is|who was)\s+(.+)', q, re.I)
+    m = _RE_WHO_IS.search(q)
     if m:
         return m.group(1).strip().rstrip('?.')
-    m = re.search(r'(.+?)\s+kimdir', q, re.I)
+    m = _RE_KIMDIR.search(q)
     if m:
         return m.group(1).strip()
     # "what is X" / "X nedir"
-    m = re.search(r'(?:what is|what are)\s+(.+)', q, re.I)
+    m = _RE_WHAT_IS.search(q)
     if m:
         return m.group(1).strip().rstrip('?.')
-    m = re.search(r'(.+?)\s+nedir', q, re.I)
+    m = _RE_NEDIR.search(q)
     if m:
         return m.group(1).strip()
     # Fallback: return whole query stripped of question marks
@@ -467,6 +527,8 @@ def compose_answer(
     query: str,
     query_type: str,
     max_sentences: int = 5,
+    *,
+    subject: Optional[str] = None,
 ) -> str:
     """
     Compose a fluent, structured answer from scored sentences.
@@ -477,8 +539,11 @@ def compose_answer(
     - comparative → list both sides
     - procedural  → ordered steps
     - general     → best sentences, original order
+
+    ``subject`` may be passed in when the caller has already extracted it.
     """
-    subject = _query_subject(query)
+    if subject is None:
+        subject = _query_subject(query)
 
     # ---- Pick top N non-duplicate sentences ----
     selected: list[Sentence] = []
@@ -486,7 +551,7 @@ def compose_answer(
     for sent in scored:
         if len(selected) >= max_sentences:
             break
-        tokens = frozenset(sent.text.lower().split())
+        tokens = sent.word_set()
         is_dup = any(
             len(tokens & ex) / max(len(tokens), 1) > 0.55
             for ex in seen
@@ -607,6 +672,7 @@ class AnswerEngine:
         summary = compose_answer(
             scored, entities, query, query_type,
             max_sentences=self.max_summary_sentences,
+            subject=subject,
         )
 
         # --- 7. Confidence label ---
@@ -627,13 +693,10 @@ class AnswerEngine:
 
     @staticmethod
     def _confidence_label(c: float) -> str:
-        if c >= 0.8:
-            return "High"
-        if c >= 0.55:
-            return "Moderate"
-        if c >= 0.3:
-            return "Low"
-        return "Very Low"
+        return next(
+            (label for threshold, label in _CONFIDENCE_LEVELS if c >= threshold),
+            "Very Low",
+        )
 
     def _empty_answer(self, query, query_type, sources, confidence):
         subject = _query_subject(query)
@@ -652,6 +715,10 @@ class AnswerEngine:
 # OUTPUT RENDERER — final presentation layer
 # ======================================================================
 
+# Host part of a URL-like source, without a leading "www."
+_RE_URL_HOST = re.compile(r'://(?:www\.)?([^/]*)')
+
+
 def render_answer(answer: StructuredAnswer, *, verbose: bool = False) -> str:
     """
     Render StructuredAnswer into a polished, terminal-friendly string.
@@ -701,8 +768,9 @@ def render_answer(answer: StructuredAnswer, *, verbose: bool = False) -> str:
         for s in answer.sources:
             label = s
             # Extract domain from URL-like sources
-            if '://' in s:
-                label = s.split('://')[1].split('/')[0].replace('www.', '')
+            m = _RE_URL_HOST.search(s)
+            if m:
+                label = m.group(1)
             elif ':' in s:
                 label = s.split(':')[0]
             label = label.strip()
@@ -0,0 +1,85 @@
+"""
+Semantic Query Cache - Embedding Tier for Paraphrased Queries
+
+"Python nedir?" ile "What is Python?" aynı cevabı hak eder.
+
+Kept apart from cache.py so the plain LRU cache stays importable
+without numpy.
+"""
+
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from .cache import QueryCache
+
+
+class SemanticQueryCache(QueryCache):
+    """
+    QueryCache with an embedding tier for paraphrased queries.
+
+    When the exact (and fuzzy, if enabled) lookups miss, the query is
+    embedded and compared by cosine similarity against the stored keys.
+    The encoder is supplied by the caller, so no model ships with Velocity.
+
+    Usage::
+
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer("all-MiniLM-L6-v2")
+
+        cache = SemanticQueryCache(model.encode, similarity_threshold=0.92)
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        similarity_threshold: float = 0.92,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            embed:                Maps a normalised query to a vector.
+            similarity_threshold: Minimum cosine similarity for a hit.
+            **kwargs:             Passed through to :class:`QueryCache`.
+        """
+        super().__init__(**kwargs)
+        self._embed = embed
+        self.similarity_threshold = similarity_threshold
+        # Unit vectors of stored keys; pruned lazily as keys leave the store
+        self._vectors: Dict[str, np.ndarray] = {}
+
+    def set(self, query: str, value: Any) -> None:
+        super().set(query, value)
+        key = self._make_key(query)
+        if key in self._store and key not in self._vectors:
+            self._vectors[key] = self._unit(self._embed(key))
+
+    def clear(self) -> None:
+        self._vectors.clear()
+        super().clear()
+
+    def _near_key(self, key: str) -> Optional[str]:
+        near = super()._near_key(key)
+        return near if near is not None else self._semantic_key(key)
+
+    def _semantic_key(self, key: str) -> Optional[str]:
+        """Return the stored key whose embedding is closest to ``key``'s."""
+        # Every stored key has a vector, so a size mismatch means stale ones
+        if len(self._vectors) != len(self._store):
+            self._vectors = {k: v for k, v in self._vectors.items() if k in self._store}
+        # Expired entries linger in the store until purged; a dead best match
+        # would shadow a live runner-up, so leave them out of the ranking
+        now = self._clock()
+        keys = [k for k in self._vectors if self._store[k][1] >= now]
+        if not keys:
+            return None
+
+        sims = np.stack([self._vectors[k] for k in keys]) @ self._unit(self._embed(key))
+        best = int(sims.argmax())
+        return keys[best] if sims[best] >= self.similarity_threshold else None
+
+    @staticmethod
+    def _unit(vector: Sequence[float]) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
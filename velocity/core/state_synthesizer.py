@@ -16,6 +16,7 @@ This state contains:
 This is not model output, but computed result.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 import statistics
@@ -487,13 +488,11 @@ class StateSynthesizer:
         hypotheses: List[Hypothesis]
     ) -> Dict[str, int]:
         """Kaynak dağılımını hesapla"""
-        breakdown = {}
-        
-        for h in hypotheses:
-            for source in h.state.sources_accessed:
-                breakdown[source] = breakdown.get(source, 0) + 1
-        
-        return breakdown
+        return dict(Counter(
+            source
+            for h in hypotheses
+            for source in h.state.sources_accessed
+        ))
     
     def _create_empty_state(
         self,
@@ -127,6 +127,9 @@ class VelocityCore:
         # Conversation memory
         self.conversation = ConversationBuffer()
         logger.info("Conversation memory enabled")
+
+        # Queries currently running through the pipeline, keyed like the cache
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         logger.info("Velocity Core Engine initialized")
     
@@ -176,6 +179,41 @@ class VelocityCore:
                 )
             return cached
 
+        # ============================================
+        # IN-FLIGHT DEDUPLICATION
+        # ============================================
+        # Identical queries that arrive while one is still running share
+        # that run instead of interrogating the network again.
+        key = QueryCache._make_key(enriched_input)
+        run = self._inflight.get(key)
+        if run is None:
+            run = asyncio.ensure_future(
+                self._run_pipeline(user_input, enriched_input, system_goal)
+            )
+            self._inflight[key] = run
+            run.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("[IN-FLIGHT] Joining identical running query")
+
+        result = await asyncio.shield(run)
+
+        # Record assistant turn in conversation memory (network answers only)
+        if session_id and result['execution_metadata'].get('network_used'):
+            self.conversation.add_assistant_turn(
+                session_id,
+                result.get('decision', ''),
+                confidence=result.get('confidence')
+            )
+
+        return result
+
+    async def _run_pipeline(
+        self,
+        user_input: str,
+        enriched_input: str,
+        system_goal: str
+    ) -> Dict[str, Any]:
+        """7-step cognitive loop for a query that missed the cache"""
         # ============================================
         # STEP 1: INTENT PARSING
         # ============================================
@@ -428,14 +466,6 @@ class VelocityCore:
 
         # Store in cache for future identical queries
         self.cache.set(enriched_input, result)
-
-        # Record assistant turn in conversation memory
-        if session_id:
-            self.conversation.add_assistant_turn(
-                session_id,
-                result.get('decision', ''),
-                confidence=result.get('confidence')
-            )
         
         return result
     
@@ -540,3 +570,9 @@ class VelocityCore:
             "estimated_time": estimated_time,
             "strategies": [s.source_type.value for s in strategies]
         }
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP clients held by the network and LLM layers"""
+        await self.network_interrogator.close()
+        if self.llm_synthesizer:
+            await self.llm_synthesizer.close()
@@ -6,7 +6,7 @@ Computation-based reasoning without GPU dependency.
 """
 
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Tuple
 from loguru import logger
 
 
@@ -52,19 +52,26 @@ class HypothesisEvaluator:
         logger.debug(f"Evaluating {len(hypotheses)} hypotheses in parallel")
         
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Score each hypothesis against evidence
+        # Tokenise each evidence text once, not once per hypothesis
+        evidence = [
+            (frozenset(item.content.lower().split()), item.confidence)
+            for evidence_list in state.knowledge.values()
+            for item in evidence_list
+        ]
+        
+        # Score each hypothesis against evidence (pure CPU, nothing to await)
         results = []
         for hypothesis in hypotheses:
-            score = await self._score_hypothesis(hypothesis, state)
+            score = self._score_hypothesis(hypothesis, state, evidence)
             results.append({
                 "hypothesis": hypothesis,
                 "score": score,
                 "method": "cpu"
             })
         
-        evaluation_time = time.time() - start_time
+        evaluation_time = time.perf_counter() - start_time
         self.total_evaluation_time += evaluation_time
         self.hypotheses_evaluated += len(hypotheses)
         
@@ -72,10 +79,11 @@ class HypothesisEvaluator:
         
         return results
     
-    async def _score_hypothesis(
+    def _score_hypothesis(
         self,
         hypothesis: str,
-        state: Any
+        state: Any,
+        evidence: List[Tuple[FrozenSet[str], float]]
     ) -> float:
         """
         Score a hypothesis against current evidence.
@@ -90,12 +98,11 @@ class HypothesisEvaluator:
         # Base score: hypothesis length (simple heuristic)
         score += min(1.0, len(hypothesis) / 200)
         
-        # Evidence support
-        for topic, evidence_list in state.knowledge.items():
-            for evidence in evidence_list:
-                # Check if hypothesis aligns with evidence
-                overlap = self._text_overlap(hypothesis, evidence.content)
-                score += overlap * evidence.confidence * 0.1
+        # Evidence support: how well does the hypothesis align with each item
+        words = frozenset(hypothesis.lower().split())
+        for evidence_words, confidence in evidence:
+            overlap = self._jaccard(words, evidence_words)
+            score += overlap * confidence * 0.1
         
         # Penalty for contradictions
         for contradiction in state.contradictions:
@@ -113,16 +120,20 @@ class HypothesisEvaluator:
         
         Simple word-based similarity measure.
         """
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+        return self._jaccard(
+            frozenset(text1.lower().split()),
+            frozenset(text2.lower().split())
+        )
+    
+    @staticmethod
+    def _jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+        """Jaccard similarity of two word sets."""
         if not words1 or not words2:
             return 0.0
         
+        # |A ∪ B| = |A| + |B| - |A ∩ B|: no union set is built
         intersection = len(words1 & words2)
-        union = len(words1 | words2)
-        
-        return intersection / union if union > 0 else 0.0
+        return intersection / (len(words1) + len(words2) - intersection)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get evaluator statistics"""
@@ -0,0 +1,50 @@
+"""
+HTML → Text
+
+Ağdan gelen ham HTML'den okunabilir metni çıkarır.
+
+Parses with lxml directly: the C parser and iterator do the work that a
+BeautifulSoup tree would otherwise rebuild in Python objects.
+"""
+
+import re
+from typing import Iterable, Optional, Union
+
+from lxml import etree
+from lxml import html as lxml_html
+
+_RE_WHITESPACE = re.compile(r'\s+')
+
+
+def extract_text(
+    content: Union[str, bytes],
+    drop_tags: Iterable[str] = ("script", "style"),
+    encoding: Optional[str] = None,
+) -> str:
+    """
+    Visible text of an HTML document, whitespace-collapsed.
+
+    Args:
+        content:   HTML as text, or raw bytes (pass ``encoding`` if known).
+        drop_tags: Elements removed with their contents (their tail text stays).
+        encoding:  Charset of ``content`` when it is bytes; sniffed otherwise.
+
+    Returns:
+        The text, or "" when the document is empty or cannot be parsed.
+    """
+    if isinstance(content, str):
+        # lxml rejects str input that carries an XML encoding declaration
+        content, encoding = content.encode("utf-8"), "utf-8"
+    if not content.strip():
+        return ""
+
+    try:
+        parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+        root = lxml_html.document_fromstring(content, parser=parser)
+    except (etree.ParserError, ValueError, LookupError):
+        return ""
+
+    for element in list(root.iter(*drop_tags)):
+        element.drop_tree()
+
+    return _RE_WHITESPACE.sub(" ", " ".join(root.itertext())).strip()
@@ -8,12 +8,159 @@ This module interrogates the network in real-time.
 """
 
 import asyncio
+import re
 import aiohttp
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from loguru import logger
-from bs4 import BeautifulSoup
 import time
 import os
+from urllib.parse import quote
+
+from ..core.cache import QueryCache
+from ..core.disk_cache import DiskCache
+from .html_text import extract_text
+
+try:  # Optional: non-blocking DNS (pip install velocity-nnei[speed])
+    import aiodns  # noqa: F401
+    _HAS_AIODNS = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HAS_AIODNS = False
+
+try:  # Optional: faster JSON decoding (pip install velocity-nnei[speed])
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on environment
+    from json import loads as _json_loads
+
+
+# Response cache lifetimes: encyclopedia summaries change slowly,
+# instant answers are refreshed more often
+WIKIPEDIA_CACHE_TTL = 24 * 3600.0
+DUCKDUCKGO_CACHE_TTL = 600.0
+
+# Endpoints, and the identifying User-Agent Wikimedia asks API clients for
+_WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+_WIKIPEDIA_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{}"
+_DUCKDUCKGO_HTML_URL = "https://html.duckduckgo.com/html/"
+_DUCKDUCKGO_API_URL = "https://api.duckduckgo.com/"
+_RESEARCH_HEADERS = {"User-Agent": "Velocity/0.2.0 (Educational Research)"}
+_DUCKDUCKGO_INSTANT_PARAMS = {"format": "json", "no_html": 1, "skip_disambig": 1}
+
+# Per-host pacing as (requests per second, burst size), kept under the
+# public APIs' limits so sustained load doesn't run into HTTP 429s
+_HOST_RATE_LIMITS = {
+    "en.wikipedia.org": (5.0, 10),
+    "api.duckduckgo.com": (2.0, 4),
+    "html.duckduckgo.com": (2.0, 4),
+}
+# Pause after a 429 that carries no usable Retry-After
+_DEFAULT_RETRY_AFTER = 1.0
+
+# Most of a results page we read; only the first 2000 chars of text are kept
+_MAX_HTML_BYTES = 128 * 1024
+
+# Command words the planner prepends/appends to topic queries
+_RE_COMMAND_WORDS = re.compile(r'answer:|documentation')
+
+
+def _clean_query(query: str) -> str:
+    """Topic part of a planner query, as sent to the lookup APIs."""
+    return _RE_COMMAND_WORDS.sub('', query).strip()
+
+# Canned answers for the offline fallback, keyed by lower-case topic
+_KNOWLEDGE_BASE = {
+    "python": "Python is a high-level, interpreted programming language created by Guido van Rossum and first released in 1991. It emphasizes code readability with significant whitespace. Python supports multiple programming paradigms including procedural, object-oriented, and functional programming.",
+    "quantum computing": "Quantum computing is a type of computation that uses quantum mechanical phenomena like superposition and entanglement. Unlike classical computers that use bits (0 or 1), quantum computers use quantum bits or qubits that can exist in multiple states simultaneously.",
+    "artificial intelligence": "Artificial Intelligence (AI) is the simulation of human intelligence processes by machines, especially computer systems. These processes include learning, reasoning, and self-correction. AI applications include expert systems, natural language processing, speech recognition and machine vision.",
+    "machine learning": "Machine learning is a subset of artificial intelligence that provides systems the ability to automatically learn and improve from experience without being explicitly programmed. It focuses on developing computer programs that can access data and use it to learn for themselves.",
+    "blockchain": "Blockchain is a distributed ledger technology that maintains a continuously growing list of records called blocks. Each block contains a cryptographic hash of the previous block, timestamp, and transaction data. It provides secure, transparent, and tamper-resistant record-keeping.",
+    "rust": "Rust is a systems programming language focused on safety, concurrency, and performance. Created by Mozilla, it prevents common bugs like null pointer dereferences and data races through its unique ownership system and borrow checker.",
+}
+
+
+class AdmissionController:
+    """
+    Concurrency cap that can be resized while queries are in flight.
+
+    Same role as an asyncio.Semaphore, but ``cap`` may change at runtime
+    (e.g. to back off on error spikes) without touching semaphore internals.
+    Shrinking never interrupts running work; it only delays new admissions.
+    """
+    
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.active = 0
+        self._cond = asyncio.Condition()
+    
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.cap)
+            self.active += 1
+    
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+    
+    async def set_cap(self, cap: int) -> None:
+        """Change the cap; waiters are admitted at once if it grew."""
+        async with self._cond:
+            self.cap = cap
+            self._cond.notify_all()
+
+
+async def _read_capped(response: aiohttp.ClientResponse, limit: int) -> bytes:
+    """Body of ``response``, reading no further than about ``limit`` bytes."""
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(16 * 1024):
+        body += chunk
+        if len(body) >= limit:
+            break
+    return bytes(body[:limit])
+
+
+class TokenBucket:
+    """
+    Request pacing for one host: ``rate`` requests per second on average,
+    with bursts of up to ``capacity``.
+
+    Waiters are served in arrival order. ``block_for`` empties the bucket
+    and holds every request back, e.g. for a server's Retry-After.
+    """
+    
+    def __init__(self, rate: float, capacity: int, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then take its token."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+    
+    def block_for(self, seconds: float) -> None:
+        """Send nothing for ``seconds``, then resume from an empty bucket."""
+        now = self._clock()
+        self._refill(now)
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self.tokens = 0.0
+    
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - max(self._updated, self._blocked_until))
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
 
 
 class NetworkInterrogator:
@@ -29,7 +176,8 @@ class NetworkInterrogator:
         max_parallel: int = 5,
         timeout: float = 10.0,
         user_agent: str = "Velocity/0.1.0",
-        use_real_search: bool = True
+        use_real_search: bool = True,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize Network Interrogator
@@ -39,11 +187,15 @@ class NetworkInterrogator:
             timeout: Request timeout in seconds
             user_agent: User agent string
             use_real_search: Use real web search (Google/Bing/DDG)
+            cache_dir: Directory for a persistent Wikipedia cache that
+                       survives restarts (e.g. "~/.cache/velocity");
+                       None keeps summaries in memory only
         """
         self.max_parallel = max_parallel
         self.timeout = timeout
         self.user_agent = user_agent
         self.use_real_search = use_real_search
+        self._request_timeout = aiohttp.ClientTimeout(total=timeout)
         
         # Initialize web search engine if enabled
         if use_real_search:
@@ -62,6 +214,28 @@ class NetworkInterrogator:
                 logger.warning(f"Could not initialize web search: {e}, falling back to simulated")
                 self.use_real_search = False
         
+        # Caps in-flight queries; extra queries wait for a slot
+        self._query_slots = AdmissionController(max_parallel)
+        
+        # Paces requests per upstream host
+        self._rate_limits = {
+            host: TokenBucket(rate, capacity)
+            for host, (rate, capacity) in _HOST_RATE_LIMITS.items()
+        }
+        
+        # Shared aiohttp session, pooled across every query (lazy: needs a loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Successful lookups, so repeated topics skip the round-trip
+        self._wikipedia_cache = QueryCache(ttl_seconds=WIKIPEDIA_CACHE_TTL)
+        self._duckduckgo_cache = QueryCache(ttl_seconds=DUCKDUCKGO_CACHE_TTL)
+        self._wikipedia_disk: Optional[DiskCache] = None
+        if cache_dir:
+            self._wikipedia_disk = DiskCache(
+                os.path.join(cache_dir, "wikipedia.sqlite3"),
+                ttl_seconds=WIKIPEDIA_CACHE_TTL
+            )
+        
         # Statistics
         self.queries_executed = 0
         self.total_latency = 0.0
@@ -69,6 +243,66 @@ class NetworkInterrogator:
         
         logger.info(f"Network Interrogator initialized (parallel={max_parallel}, real_search={use_real_search})")
     
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Lazy-initialize shared aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    # aiodns resolves on the loop instead of a getaddrinfo thread
+                    resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+                    limit=100,
+                    limit_per_host=self.max_parallel,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                headers={"User-Agent": self.user_agent}
+            )
+        return self._session
+    
+    async def __aenter__(self) -> "NetworkInterrogator":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def set_max_parallel(self, max_parallel: int) -> None:
+        """
+        Change the in-flight query cap at runtime.
+
+        The connector's per-host limit is fixed once the session exists,
+        so it applies from the next session.
+        """
+        self.max_parallel = max_parallel
+        await self._query_slots.set_cap(max_parallel)
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and the web search client."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if hasattr(self, 'web_search'):
+            await self.web_search.close()
+        if self._wikipedia_disk is not None:
+            self._wikipedia_disk.close()
+            self._wikipedia_disk = None
+    
+    async def _pace(self, host: str) -> None:
+        """Wait for ``host``'s rate limit before sending a request."""
+        bucket = self._rate_limits.get(host)
+        if bucket is not None:
+            await bucket.acquire()
+    
+    def _note_rate_limited(self, host: str, response: aiohttp.ClientResponse) -> None:
+        """On HTTP 429, hold back further requests to ``host`` for Retry-After."""
+        if response.status != 429 or host not in self._rate_limits:
+            return
+        try:
+            delay = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            delay = _DEFAULT_RETRY_AFTER
+        logger.warning(f"Rate limited by {host}, pausing {delay:.1f}s")
+        self._rate_limits[host].block_for(delay)
+    
     async def search_parallel(
         self,
         queries: List[str],
@@ -89,16 +323,17 @@ class NetworkInterrogator:
         """
         logger.debug(f"Executing {len(queries)} parallel queries")
         
-        # Create tasks for parallel execution
-        tasks = [
-            self._execute_query(query, search_engine)
-            for query in queries[:self.max_parallel]
-        ]
+        # Create tasks for parallel execution, at most max_parallel at a time
+        async def bounded(query: str) -> Dict[str, Any]:
+            async with self._query_slots:
+                return await self._execute_query(query, search_engine)
+        
+        tasks = [bounded(query) for query in queries]
         
         # Execute in parallel
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        latency = time.time() - start_time
+        latency = time.perf_counter() - start_time
         
         self.total_latency += latency
         logger.debug(f"Parallel queries completed in {latency:.2f}s")
@@ -181,21 +416,26 @@ class NetworkInterrogator:
                 except Exception as e:
                     logger.warning(f"⚠️ Real web search failed: {e}")
             
-            # 1. Wikipedia (best for encyclopedic knowledge)
+            # 1. Wikipedia (best for encyclopedic knowledge), then
+            # 2. DuckDuckGo instant answer. Both start at once so a Wikipedia
+            #    miss costs max(t_wiki, t_ddg), not the sum; Wikipedia still
+            #    wins whenever it has an answer.
+            wikipedia = asyncio.ensure_future(self._query_wikipedia_simple(query))
+            duckduckgo = asyncio.ensure_future(self._query_duckduckgo_instant(query))
             try:
-                result = await self._query_wikipedia_simple(query)
-                if result["success"]:
-                    return result
-            except Exception as e:
-                logger.debug(f"Wikipedia failed: {e}")
-            
-            # 2. Try DuckDuckGo instant answer
-            try:
-                result = await self._query_duckduckgo_instant(query)
-                if result["success"]:
-                    return result
-            except Exception as e:
-                logger.debug(f"DuckDuckGo instant failed: {e}")
+                for name, task in (("Wikipedia", wikipedia), ("DuckDuckGo instant", duckduckgo)):
+                    try:
+                        result = await task
+                        if result["success"]:
+                            return result
+                    except Exception as e:
+                        logger.debug(f"{name} failed: {e}")
+            finally:
+                for task in (wikipedia, duckduckgo):
+                    if not task.done():
+                        task.cancel()
+                    elif not task.cancelled():
+                        task.exception()  # retrieved: never "unhandled"
             
             # 3. Fallback to simulated (with better content)
             return await self._simulated_search_enhanced(query)
@@ -215,39 +455,37 @@ class NetworkInterrogator:
         Note: For production, you'd want to use proper API or services.
         This is a demonstration.
         """
-        url = "https://html.duckduckgo.com/html/"
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    url,
-                    data={"q": query},
-                    headers={"User-Agent": self.user_agent},
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
+        try:
+            await self._pace("html.duckduckgo.com")
+            async with self.session.post(
+                _DUCKDUCKGO_HTML_URL,
+                data={"q": query},
+                timeout=self._request_timeout
+            ) as response:
+                self._note_rate_limited("html.duckduckgo.com", response)
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
                     
-                    html = await response.text()
-                    content = self._extract_content_from_html(html)
+                html = await _read_capped(response, _MAX_HTML_BYTES)
+                content = self._extract_content_from_html(html, response.charset)
                     
-                    return {
-                        "success": True,
-                        "query": query,
-                        "source": "duckduckgo",
-                        "content": content,
-                        "metadata": {
-                            "url": str(response.url),
-                            "status": response.status
-                        }
-                    }
-            except asyncio.TimeoutError:
-                logger.warning(f"Query timeout: {query}")
                 return {
-                    "success": False,
+                    "success": True,
                     "query": query,
-                    "error": "timeout"
+                    "source": "duckduckgo",
+                    "content": content,
+                    "metadata": {
+                        "url": str(response.url),
+                        "status": response.status
+                    }
                 }
+        except asyncio.TimeoutError:
+            logger.warning(f"Query timeout: {query}")
+            return {
+                "success": False,
+                "query": query,
+                "error": "timeout"
+            }
     
     async def _query_wikipedia(self, query: str) -> Dict[str, Any]:
         """
@@ -258,8 +496,6 @@ class NetworkInterrogator:
         - Well-structured
         - Contradictions documented
         """
-        url = "https://en.wikipedia.org/w/api.php"
-        
         # First try: search for the page
         search_params = {
             "action": "opensearch",
@@ -268,151 +504,167 @@ class NetworkInterrogator:
             "limit": 1
         }
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                # Step 1: Search for matching page
-                async with session.get(
-                    url,
-                    params=search_params,
-                    headers={"User-Agent": self.user_agent},
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as search_response:
-                    if search_response.status != 200:
-                        raise Exception(f"HTTP {search_response.status}")
+        try:
+            # Step 1: Search for matching page
+            await self._pace("en.wikipedia.org")
+            async with self.session.get(
+                _WIKIPEDIA_API_URL,
+                params=search_params,
+                timeout=self._request_timeout
+            ) as search_response:
+                self._note_rate_limited("en.wikipedia.org", search_response)
+                if search_response.status != 200:
+                    raise Exception(f"HTTP {search_response.status}")
                     
-                    search_data = await search_response.json()
+                search_data = _json_loads(await search_response.read())
                     
-                    # Get the first matching title
-                    if not search_data or len(search_data) < 2 or not search_data[1]:
-                        raise Exception(f"No Wikipedia page found for: {query}")
+                # Get the first matching title
+                if not search_data or len(search_data) < 2 or not search_data[1]:
+                    raise Exception(f"No Wikipedia page found for: {query}")
                     
-                    page_title = search_data[1][0]
-                    logger.debug(f"Found Wikipedia page: {page_title}")
+                page_title = search_data[1][0]
+                logger.debug(f"Found Wikipedia page: {page_title}")
                 
-                # Step 2: Get page content
-                content_params = {
-                    "action": "query",
-                    "format": "json",
-                    "prop": "extracts",
-                    "exintro": True,
-                    "explaintext": True,
-                    "titles": page_title,
-                }
+            # Step 2: Get page content
+            content_params = {
+                "action": "query",
+                "format": "json",
+                "prop": "extracts",
+                "exintro": True,
+                "explaintext": True,
+                "titles": page_title,
+            }
                 
-                async with session.get(
-                    url,
-                    params=content_params,
-                    headers={"User-Agent": self.user_agent},
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
+            await self._pace("en.wikipedia.org")
+            async with self.session.get(
+                _WIKIPEDIA_API_URL,
+                params=content_params,
+                timeout=self._request_timeout
+            ) as response:
+                self._note_rate_limited("en.wikipedia.org", response)
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
                     
-                    data = await response.json()
-                    pages = data.get("query", {}).get("pages", {})
+                data = _json_loads(await response.read())
+                pages = data.get("query", {}).get("pages", {})
                     
-                    # Extract content
-                    content = ""
-                    page_id = ""
-                    for pid, page_data in pages.items():
-                        if "extract" in page_data:
-                            content = page_data["extract"]
-                            page_id = pid
-                            break
+                # Extract content
+                content = ""
+                page_id = ""
+                for pid, page_data in pages.items():
+                    if "extract" in page_data:
+                        content = page_data["extract"]
+                        page_id = pid
+                        break
                     
-                    if not content:
-                        raise Exception("No content extracted from Wikipedia")
+                if not content:
+                    raise Exception("No content extracted from Wikipedia")
                     
-                    logger.info(f"Successfully retrieved Wikipedia content for '{page_title}' ({len(content)} chars)")
+                logger.info(f"Successfully retrieved Wikipedia content for '{page_title}' ({len(content)} chars)")
                     
-                    return {
-                        "success": True,
-                        "query": query,
-                        "source": f"wikipedia:{page_title}",
-                        "content": content,
-                        "metadata": {
-                            "page_id": page_id,
-                            "title": page_title,
-                            "url": f"https://en.wikipedia.org/wiki/{page_title.replace(' ', '_')}"
-                        }
+                return {
+                    "success": True,
+                    "query": query,
+                    "source": f"wikipedia:{page_title}",
+                    "content": content,
+                    "metadata": {
+                        "page_id": page_id,
+                        "title": page_title,
+                        "url": f"https://en.wikipedia.org/wiki/{quote(page_title.replace(' ', '_'), safe='')}"
                     }
-            except asyncio.TimeoutError:
-                logger.warning(f"Wikipedia query timeout: {query}")
-                raise Exception("timeout")
-            except Exception as e:
-                logger.warning(f"Wikipedia query failed for '{query}': {e}")
-                raise
+                }
+        except asyncio.TimeoutError:
+            logger.warning(f"Wikipedia query timeout: {query}")
+            raise Exception("timeout")
+        except Exception as e:
+            logger.warning(f"Wikipedia query failed for '{query}': {e}")
+            raise
     
     async def _query_wikipedia_simple(self, query: str) -> Dict[str, Any]:
         """Simple Wikipedia query without search API"""
         # Clean query - remove command words
-        clean_query = query.replace("answer:", "").replace("documentation", "").strip()
+        clean_query = _clean_query(query)
         
-        url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{clean_query.replace(' ', '_')}"
+        cached = self._wikipedia_cache.get(clean_query)
+        if cached is None and self._wikipedia_disk is not None:
+            # SQLite I/O blocks; keep it off the event loop
+            cached = await asyncio.to_thread(self._wikipedia_disk.get, clean_query)
+            if cached is not None:
+                self._wikipedia_cache.set(clean_query, cached)
+        if cached is not None:
+            return {**cached, "query": query}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers={"User-Agent": "Velocity/0.2.0 (Educational Research)"},
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    content = data.get("extract", "")
+        # Percent-encode the title so '/', '?', '#' and non-ASCII stay in the path
+        url = _WIKIPEDIA_SUMMARY_URL.format(quote(clean_query.replace(' ', '_'), safe=''))
+        
+        await self._pace("en.wikipedia.org")
+        async with self.session.get(
+            url,
+            headers=_RESEARCH_HEADERS,
+            timeout=self._request_timeout
+        ) as response:
+            self._note_rate_limited("en.wikipedia.org", response)
+            if response.status == 200:
+                data = _json_loads(await response.read())
+                content = data.get("extract", "")
                     
-                    if content:
-                        logger.info(f"Wikipedia SUCCESS: {data.get('title', clean_query)}")
-                        return {
-                            "success": True,
-                            "query": query,
-                            "source": f"wikipedia:{data.get('title', clean_query)}",
-                            "content": content,
-                            "metadata": {
-                                "title": data.get("title"),
-                                "url": data.get("content_urls", {}).get("desktop", {}).get("page", "")
-                            }
+                if content:
+                    logger.info(f"Wikipedia SUCCESS: {data.get('title', clean_query)}")
+                    result = {
+                        "success": True,
+                        "query": query,
+                        "source": f"wikipedia:{data.get('title', clean_query)}",
+                        "content": content,
+                        "metadata": {
+                            "title": data.get("title"),
+                            "url": data.get("content_urls", {}).get("desktop", {}).get("page", "")
                         }
+                    }
+                    self._wikipedia_cache.set(clean_query, result)
+                    if self._wikipedia_disk is not None:
+                        await asyncio.to_thread(self._wikipedia_disk.set, clean_query, result)
+                    return result
                 
-                raise Exception(f"HTTP {response.status}")
+            raise Exception(f"HTTP {response.status}")
     
     async def _query_duckduckgo_instant(self, query: str) -> Dict[str, Any]:
         """Query DuckDuckGo Instant Answer API"""
-        clean_query = query.replace("answer:", "").replace("documentation", "").strip()
-        url = "https://api.duckduckgo.com/"
-        params = {
-            "q": clean_query,
-            "format": "json",
-            "no_html": 1,
-            "skip_disambig": 1
-        }
+        clean_query = _clean_query(query)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                params=params,
-                headers={"User-Agent": "Velocity/0.2.0 (Educational Research)"},
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
+        cached = self._duckduckgo_cache.get(clean_query)
+        if cached is not None:
+            return {**cached, "query": query}
+        
+        await self._pace("api.duckduckgo.com")
+        async with self.session.get(
+            _DUCKDUCKGO_API_URL,
+            params={**_DUCKDUCKGO_INSTANT_PARAMS, "q": clean_query},
+            headers=_RESEARCH_HEADERS,
+            timeout=self._request_timeout
+        ) as response:
+            self._note_rate_limited("api.duckduckgo.com", response)
+            if response.status == 200:
+                data = _json_loads(await response.read())
                     
-                    # Try to get content from instant answer
-                    content = data.get("AbstractText") or data.get("Abstract")
+                # Try to get content from instant answer
+                content = data.get("AbstractText") or data.get("Abstract")
                     
-                    if content and len(content) > 50:
-                        logger.info(f"DuckDuckGo SUCCESS: {clean_query}")
-                        return {
-                            "success": True,
-                            "query": query,
-                            "source": f"duckduckgo:{data.get('Heading', clean_query)}",
-                            "content": content,
-                            "metadata": {
-                                "heading": data.get("Heading"),
-                                "url": data.get("AbstractURL", "")
-                            }
+                if content and len(content) > 50:
+                    logger.info(f"DuckDuckGo SUCCESS: {clean_query}")
+                    result = {
+                        "success": True,
+                        "query": query,
+                        "source": f"duckduckgo:{data.get('Heading', clean_query)}",
+                        "content": content,
+                        "metadata": {
+                            "heading": data.get("Heading"),
+                            "url": data.get("AbstractURL", "")
                         }
+                    }
+                    self._duckduckgo_cache.set(clean_query, result)
+                    return result
                 
-                raise Exception(f"No instant answer available")
+            raise Exception(f"No instant answer available")
     
     async def _simulated_search_enhanced(self, query: str) -> Dict[str, Any]:
         """
@@ -424,17 +676,8 @@ class NetworkInterrogator:
         await asyncio.sleep(0.3)  # Simulate network latency
         
         # Extract topic from query
-        clean_query = query.replace("answer:", "").replace("documentation", "").strip()
-        
-        # Knowledge base for common queries
-        knowledge_base = {
-            "python": "Python is a high-level, interpreted programming language created by Guido van Rossum and first released in 1991. It emphasizes code readability with significant whitespace. Python supports multiple programming paradigms including procedural, object-oriented, and functional programming.",
-            "quantum computing": "Quantum computing is a type of computation that uses quantum mechanical phenomena like superposition and entanglement. Unlike classical computers that use bits (0 or 1), quantum computers use quantum bits or qubits that can exist in multiple states simultaneously.",
-            "artificial intelligence": "Artificial Intelligence (AI) is the simulation of human intelligence processes by machines, especially computer systems. These processes include learning, reasoning, and self-correction. AI applications include expert systems, natural language processing, speech recognition and machine vision.",
-            "machine learning": "Machine learning is a subset of artificial intelligence that provides systems the ability to automatically learn and improve from experience without being explicitly programmed. It focuses on developing computer programs that can access data and use it to learn for themselves.",
-            "blockchain": "Blockchain is a distributed ledger technology that maintains a continuously growing list of records called blocks. Each block contains a cryptographic hash of the previous block, timestamp, and transaction data. It provides secure, transparent, and tamper-resistant record-keeping.",
-            "rust": "Rust is a systems programming language focused on safety, concurrency, and performance. Created by Mozilla, it prevents common bugs like null pointer dereferences and data races through its unique ownership system and borrow checker.",
-        }
+        clean_query = _clean_query(query)
+        
         
         # Code generation responses
         code_requests = {
@@ -730,12 +973,16 @@ SELECT COUNT(*) as total_users FROM users;''',
                 content = f"Here's a Python code example:\n\n{code_requests['python']}"
                 matched_key = "python_code"
         else:
-            # Regular knowledge base lookup
-            for key, value in knowledge_base.items():
-                if key in query_lower or query_lower in key:
-                    content = value
-                    matched_key = key
-                    break
+            # Regular knowledge base lookup: exact topic first, then substring
+            content = _KNOWLEDGE_BASE.get(query_lower, "")
+            if content:
+                matched_key = query_lower
+            else:
+                for key, value in _KNOWLEDGE_BASE.items():
+                    if key in query_lower or query_lower in key:
+                        content = value
+                        matched_key = key
+                        break
         
         if not content:
             content = (
@@ -760,25 +1007,18 @@ SELECT COUNT(*) as total_users FROM users;''',
             }
         }
     
-    def _extract_content_from_html(self, html: str) -> str:
+    def _extract_content_from_html(
+        self,
+        html: Union[str, bytes],
+        encoding: Optional[str] = None
+    ) -> str:
         """
         Extract meaningful content from HTML.
         
         Network returns raw HTML. We need to extract signal from noise.
         """
-        soup = BeautifulSoup(html, "lxml")
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = " ".join(chunk for chunk in chunks if chunk)
+        # Text without script/style contents, whitespace collapsed
+        text = extract_text(html, encoding=encoding)
         
         # Limit length
         return text[:2000]
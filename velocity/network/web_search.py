@@ -7,6 +7,7 @@ Velocity'nin asıl gücü: LLM yok, sadece web'den bilgi çekip NLP ile işle.
 "Intelligence lives in the speed of interrogation, not in the size of memory."
 """
 
+import asyncio
 import httpx
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
@@ -15,6 +16,13 @@ from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from .html_text import extract_text
+
+try:  # Optional: faster JSON decoding (pip install velocity-nnei[speed])
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on environment
+    from json import loads as _json_loads
+
 
 @dataclass
 class SearchResult:
@@ -67,7 +75,17 @@ class WebSearchEngine:
             self._client = httpx.AsyncClient(
                 headers=self.headers,
                 timeout=self.timeout,
-                follow_redirects=True
+                follow_redirects=True,
+                # Limits belong to the transport: a client given one ignores its own.
+                # Retries cover connect failures only, never a sent request
+                transport=httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=32,
+                        keepalive_expiry=60
+                    ),
+                    retries=2
+                )
             )
         return self._client
 
@@ -127,15 +145,23 @@ class WebSearchEngine:
             except Exception as e:
                 logger.warning(f"Code search failed: {e}")
         
-        # Limit results
-        results = results[:self.max_results]
-        
-        # Fetch full content for top results
-        for result in results[:3]:  # Only top 3
-            try:
-                result.content = await self._fetch_content(result.url)
-            except Exception as e:
-                logger.debug(f"Failed to fetch content from {result.url}: {e}")
+        # Drop URLs already returned by an earlier backend, then limit results
+        unique: Dict[str, SearchResult] = {}
+        for result in results:
+            unique.setdefault(result.url, result)
+        results = list(unique.values())[:self.max_results]
+        
+        # Fetch full content for top results, concurrently
+        top = results[:3]  # Only top 3
+        contents = await asyncio.gather(
+            *(self._fetch_content(result.url) for result in top),
+            return_exceptions=True
+        )
+        for result, content in zip(top, contents):
+            if isinstance(content, Exception):
+                logger.debug(f"Failed to fetch content from {result.url}: {content}")
+            else:
+                result.content = content
         
         return results
     
@@ -152,7 +178,7 @@ class WebSearchEngine:
         response = await self.client.get(url, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         results = []
         
         for item in data.get('items', []):
@@ -183,7 +209,7 @@ class WebSearchEngine:
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         results = []
         
         for item in data.get('webPages', {}).get('value', []):
@@ -270,7 +296,7 @@ class WebSearchEngine:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 for item in data.get('items', [])[:3]:
                     results.append(SearchResult(
                         url=item['html_url'],
@@ -298,7 +324,7 @@ class WebSearchEngine:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 for item in data.get('items', [])[:3]:
                     # Get accepted answer if available
                     answer_text = ""
@@ -330,18 +356,12 @@ class WebSearchEngine:
             response = await self.client.get(url)
             response.raise_for_status()
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(['script', 'style', 'nav', 'footer', 'header']):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text)
+            # Parse HTML, dropping scripts, styles and page chrome
+            text = extract_text(
+                response.content,
+                drop_tags=('script', 'style', 'nav', 'footer', 'header'),
+                encoding=response.encoding
+            )
             
             # Limit length (first 5000 characters)
             return text[:5000]
@@ -0,0 +1,22 @@
+"""
+Runtime - Event Loop Selection for Entry Points
+
+Velocity'nin iş yükü ağ ağırlıklıdır; uvloop kuruluysa onu kullan.
+
+uvloop is optional (``pip install velocity-nnei[speed]``) and unavailable
+on Windows; without it entry points run on the standard asyncio loop.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -11,13 +11,138 @@ Preserves NNEI paradigm: LLM used ONLY for formatting, not facts.
 """
 
 import asyncio
+import functools
+import hashlib
 import os
+import re
+import time
+import weakref
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
 from enum import Enum
 
 import httpx
 from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ..core.cache import QueryCache
+
+try:  # Optional: faster JSON decoding (pip install velocity-nnei[speed])
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on environment
+    from json import loads as _json_loads
+
+try:  # Optional: HTTP/2 multiplexing to cloud providers (pip install velocity-nnei[speed])
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HAS_H2 = False
+
+
+# Seconds a finished health probe stays valid
+HEALTH_CHECK_TTL = 60.0
+
+# Seconds a successful synthesis is reused for identical input
+SYNTHESIS_CACHE_TTL = 600.0
+
+# Backoff bounds (seconds) between retries of a transient provider failure
+RETRY_WAIT_MIN = 0.2
+RETRY_WAIT_MAX = 4.0
+
+# HTTP statuses worth retrying: timeouts, rate limits, server-side errors
+_RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+_GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+_OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+_ANTHROPIC_URL = "https://api.anthropic.com/v1/messages"
+
+# Common end-of-turn markers for local models served by Ollama
+_STOP_TOKENS = ["</s>", "<|im_end|>"]
+
+_GROQ_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a synthesis assistant. Transform raw facts into natural, fluent text. Preserve all factual content. Be concise and clear."
+}
+_SYNTHESIS_SYSTEM_PROMPT = "You are a synthesis assistant. Rewrite raw facts in natural, concise language. Preserve all factual content."
+
+# Facts that already read as a finished English answer: one line, capitalised,
+# at most two sentences, each ending in terminal punctuation
+_RE_DIRECT_PROSE = re.compile(r'[A-Z][^\n.!?]*[.!?](?: [A-Z][^\n.!?]*[.!?])?')
+# Longest facts passed through without a rewrite
+_DIRECT_MAX_CHARS = 300
+
+# Fixed head of every synthesis prompt (simple and direct works better with Qwen)
+_PROMPT_PREFIX = """You are a helpful assistant. Rewrite the following information in natural, fluent language.
+
+Instructions:
+- Write 2-3 clear sentences
+- Keep all facts accurate
+- Be natural and conversational
+- Don't mention sources
+
+"""
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """
+    Whether a provider error is transient enough to try again. Refused
+    connections are not: the transport already retried them, and a local
+    Ollama that isn't running should fall back at once.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUSES
+    return isinstance(error, httpx.TimeoutException)
+
+
+# Request headers depend only on the API key, so each key's dict is built
+# once and shared across requests (httpx never mutates it)
+@functools.lru_cache(maxsize=8)
+def _bearer_headers(api_key: str) -> Dict[str, str]:
+    """Headers for OpenAI-compatible APIs (OpenAI, Groq)."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _anthropic_headers(api_key: str) -> Dict[str, str]:
+    """Headers for the Anthropic Messages API."""
+    return {
+        "x-api-key": api_key,
+        "anthropic-version": "2023-06-01",
+        "Content-Type": "application/json",
+    }
+
+
+def _warn_unclosed(client: Optional[httpx.AsyncClient]) -> None:
+    """Finalizer for an LLMSynthesizer whose close() was never awaited."""
+    if client is not None and not client.is_closed:
+        logger.warning("LLMSynthesizer was not closed; its HTTP connections leak until exit")
+
+
+async def _iter_byte_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    """
+    Non-empty lines of a streamed body, as raw bytes.
+
+    Both JSON decoders take bytes, so lines are never decoded to str and
+    no per-line text objects are built for NDJSON/SSE framing.
+    """
+    pending = b""
+    async for chunk in response.aiter_bytes():
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if line:
+                yield line
+    pending = pending.rstrip(b"\r")
+    if pending:
+        yield pending
 
 
 class LLMProvider(Enum):
@@ -29,7 +154,23 @@ class LLMProvider(Enum):
     NONE = "none"               # Fallback: no LLM synthesis
 
 
-@dataclass
+# Provider → LLMSynthesizer method; resolved by name so subclass overrides apply
+_SYNTHESIS_METHODS = {
+    LLMProvider.OLLAMA: "_synthesize_ollama",
+    LLMProvider.GROQ: "_synthesize_groq",
+    LLMProvider.OPENAI: "_synthesize_openai",
+    LLMProvider.ANTHROPIC: "_synthesize_anthropic",
+}
+
+# Cloud provider → SynthesisConfig field holding its API key
+_API_KEY_FIELDS = {
+    LLMProvider.GROQ: "groq_api_key",
+    LLMProvider.OPENAI: "openai_api_key",
+    LLMProvider.ANTHROPIC: "anthropic_api_key",
+}
+
+
+@dataclass(slots=True)
 class SynthesisConfig:
     """Configuration for LLM synthesis"""
     provider: LLMProvider = LLMProvider.OLLAMA
@@ -39,6 +180,20 @@ class SynthesisConfig:
     timeout: int = 30
     stream: bool = False        # Enable server-sent streaming
 
+    # Connection pool of the synthesizer's own HTTP client
+    max_connections: int = 100
+    max_keepalive: int = 20
+
+    # synthesize_many() calls in flight at once
+    max_concurrency: int = 16
+
+    # Transient failures (429/5xx/timeouts) are retried with jittered backoff;
+    # after circuit_failures failed calls in a row the provider is skipped
+    # (straight to fallback) for circuit_cooldown seconds
+    max_retries: int = 2
+    circuit_failures: int = 5
+    circuit_cooldown: float = 30.0
+
     # API keys (loaded from env if not set)
     groq_api_key: Optional[str] = None
     openai_api_key: Optional[str] = None
@@ -46,6 +201,10 @@ class SynthesisConfig:
     
     # Ollama settings
     ollama_host: str = "http://localhost:11434"
+    # How long Ollama keeps the model (and its cached prompt prefix) loaded
+    # after a request; start the server with OLLAMA_NUM_PARALLEL > 1 to
+    # serve concurrent syntheses from separate slots
+    ollama_keep_alive: str = "30m"
     
     # Fallback behavior
     fallback_to_raw: bool = True  # If LLM fails, return raw
@@ -69,7 +228,24 @@ class LLMSynthesizer:
         )
     """
     
-    def __init__(self, config: Optional[SynthesisConfig] = None):
+    def __init__(
+        self,
+        config: Optional[SynthesisConfig] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.92
+    ):
+        """
+        Args:
+            config: Synthesis settings (defaults to SynthesisConfig()).
+            client: Shared HTTP client to reuse across synthesizers.  Its own
+                    settings (timeout included) apply and close() leaves it
+                    open; by default the synthesizer owns a private client.
+            embed:  Query encoder enabling a semantic cache tier: a paraphrase
+                    of a recently answered query (cosine similarity at least
+                    ``similarity_threshold``) reuses that answer, provided
+                    the facts and sources are unchanged.
+        """
         self.config = config or SynthesisConfig()
         
         # Load API keys from environment
@@ -80,8 +256,54 @@ class LLMSynthesizer:
         if not self.config.anthropic_api_key:
             self.config.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
         
-        # HTTP client
-        self.client = httpx.AsyncClient(timeout=self.config.timeout)
+        # HTTP client, kept alive across synthesize() calls
+        self._owns_client = client is None
+        # (pool settings go on the transport: a client given one ignores its own)
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(self.config.timeout, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive,
+                    keepalive_expiry=60
+                ),
+                http2=_HAS_H2,
+                retries=2
+            )
+        )
+
+        # Flags a private client that was never closed when we are collected
+        self._finalizer = weakref.finalize(
+            self, _warn_unclosed, self.client if self._owns_client else None
+        )
+
+        # Latest health probe, shared by concurrent health_check() callers
+        # and reused for HEALTH_CHECK_TTL seconds once it has finished
+        self._health_probe: Optional[asyncio.Future] = None
+        self._health_probe_started = 0.0
+
+        # Successful syntheses, keyed on provider/model settings and input
+        self._result_cache = QueryCache(ttl_seconds=SYNTHESIS_CACHE_TTL)
+        # Optional paraphrase tier, keyed on the query alone; entries carry
+        # the settings and facts digest they were produced from
+        self._semantic_cache = None
+        if embed is not None:
+            from ..core.semantic_cache import SemanticQueryCache
+            self._semantic_cache = SemanticQueryCache(
+                embed,
+                similarity_threshold=similarity_threshold,
+                ttl_seconds=SYNTHESIS_CACHE_TTL
+            )
+        # Upstream calls still running, by the same key
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        # Answers passed through without calling the provider
+        self.direct_answers = 0
+
+        # Circuit breaker per provider: consecutive failed calls, and the
+        # monotonic time until which the provider is skipped
+        self._failures: Dict[LLMProvider, int] = {}
+        self._circuit_open_until: Dict[LLMProvider, float] = {}
         
         logger.info(f"LLM Synthesizer initialized: {self.config.provider.value}")
     
@@ -106,7 +328,8 @@ class LLMSynthesizer:
                 'natural_answer': str,  # Fluent, natural text
                 'provider': str,        # Which LLM was used
                 'success': bool,        # Synthesis successful
-                'fallback': bool        # Whether fallback was used
+                'fallback': bool,       # Whether fallback was used
+                'cached': bool          # Served from the result cache
             }
         """
         
@@ -116,28 +339,53 @@ class LLMSynthesizer:
                 'natural_answer': raw_facts,
                 'provider': 'none',
                 'success': True,
-                'fallback': True
+                'fallback': True,
+                'cached': False
+            }
+        
+        # Nothing for the model to improve on: skip the round-trip
+        if self._should_skip_llm(raw_facts, query, language):
+            self.direct_answers += 1
+            return {
+                'natural_answer': raw_facts.strip(),
+                'provider': 'direct',
+                'success': True,
+                'fallback': False,
+                'cached': False
             }
         
+        input_key = self._input_key(raw_facts, sources, language)
+        cache_key = f"{input_key} | {query}"
+        cached = self._result_cache.get(cache_key)
+        if cached is None and self._semantic_cache is not None:
+            # A paraphrase only counts if it was answered from these same facts
+            near = self._semantic_cache.get(query)
+            if near is not None and near[0] == input_key:
+                cached = near[1]
+        if cached is not None:
+            return {**cached, 'cached': True}
+
         try:
-            # Try primary provider
-            if self.config.provider == LLMProvider.OLLAMA:
-                result = await self._synthesize_ollama(raw_facts, sources, query, language)
-            elif self.config.provider == LLMProvider.GROQ:
-                result = await self._synthesize_groq(raw_facts, sources, query, language)
-            elif self.config.provider == LLMProvider.OPENAI:
-                result = await self._synthesize_openai(raw_facts, sources, query, language)
-            elif self.config.provider == LLMProvider.ANTHROPIC:
-                result = await self._synthesize_anthropic(raw_facts, sources, query, language)
-            else:
-                raise ValueError(f"Unknown provider: {self.config.provider}")
+            # Identical requests already in flight share one upstream call
+            call = self._in_flight.get(cache_key)
+            if call is None:
+                call = asyncio.ensure_future(
+                    self._call_provider(raw_facts, sources, query, language)
+                )
+                self._in_flight[cache_key] = call
+                call.add_done_callback(lambda done: self._call_finished(cache_key, done))
+            result = await asyncio.shield(call)
             
-            return {
+            answer = {
                 'natural_answer': result,
                 'provider': self.config.provider.value,
                 'success': True,
                 'fallback': False
             }
+            self._result_cache.set(cache_key, answer)
+            if self._semantic_cache is not None:
+                self._semantic_cache.set(query, (input_key, answer))
+            return {**answer, 'cached': False}
         
         except Exception as e:
             logger.warning(f"LLM synthesis failed: {e}")
@@ -148,11 +396,164 @@ class LLMSynthesizer:
                     'natural_answer': raw_facts,
                     'provider': 'fallback',
                     'success': False,
-                    'fallback': True
+                    'fallback': True,
+                    'cached': False
                 }
             else:
                 raise
     
+    async def synthesize_many(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Synthesize several answers concurrently.
+
+        Each item holds synthesize() keyword arguments (raw_facts, sources,
+        query and optionally language). At most ``config.max_concurrency``
+        run at once. Results come back in input order; an item that raised
+        (only possible with fallback_to_raw off) yields its exception.
+        """
+        slots = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def bounded(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with slots:
+                return await self.synthesize(**item)
+
+        return await asyncio.gather(*(bounded(item) for item in items), return_exceptions=True)
+
+    @staticmethod
+    def _should_skip_llm(raw_facts: str, query: str, language: str) -> bool:
+        """
+        True when a rewrite cannot add anything: the facts are blank, or
+        they are already a short English answer to an English query (a
+        non-English side would still need the model to translate).
+        """
+        facts = raw_facts.strip()
+        if not facts:
+            return True
+        return (
+            language == "auto"
+            and len(facts) <= _DIRECT_MAX_CHARS
+            and query.isascii()
+            and facts.isascii()
+            and _RE_DIRECT_PROSE.fullmatch(facts) is not None
+        )
+
+    async def _call_provider(
+        self,
+        raw_facts: str,
+        sources: List[str],
+        query: str,
+        language: str
+    ) -> str:
+        """
+        Run one synthesis against the configured provider, retrying
+        transient failures, unless its circuit breaker is open.
+        """
+        provider = self.config.provider
+        method = _SYNTHESIS_METHODS.get(provider)
+        if method is None:
+            raise ValueError(f"Unknown provider: {provider}")
+        if time.monotonic() < self._circuit_open_until.get(provider, 0.0):
+            raise RuntimeError(f"{provider.value} circuit open after repeated failures")
+
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.config.max_retries + 1),
+                wait=wait_random_exponential(min=RETRY_WAIT_MIN, max=RETRY_WAIT_MAX),
+                retry=retry_if_exception(_is_retryable),
+                reraise=True
+            ):
+                with attempt:
+                    result = await getattr(self, method)(raw_facts, sources, query, language)
+        except Exception:
+            failures = self._failures.get(provider, 0) + 1
+            self._failures[provider] = failures
+            if failures >= self.config.circuit_failures:
+                logger.warning(f"{provider.value} failed {failures}x; skipping it for {self.config.circuit_cooldown:.0f}s")
+                self._circuit_open_until[provider] = time.monotonic() + self.config.circuit_cooldown
+                self._failures[provider] = 0
+            raise
+        self._failures[provider] = 0
+        return result
+
+    def _call_finished(self, cache_key: str, call: asyncio.Future) -> None:
+        """Forget a finished upstream call; its waiters already hold it."""
+        if self._in_flight.get(cache_key) is call:
+            del self._in_flight[cache_key]
+        if not call.cancelled():
+            call.exception()  # retrieved: never "unhandled" if all waiters left
+
+    async def synthesize_stream(
+        self,
+        raw_facts: str,
+        sources: List[str],
+        query: str,
+        language: str = "auto"
+    ) -> AsyncIterator[str]:
+        """
+        Synthesize like synthesize(), yielding text as it is generated.
+
+        Tokens are forwarded as the provider emits them, so the caller can
+        start printing or post-processing before decoding finishes. The
+        result cache is bypassed, and provider NONE yields the raw facts.
+
+        If the provider fails before the first token and fallback_to_raw
+        is set, the raw facts are yielded instead; a failure mid-stream
+        is raised, since part of the answer has already been delivered.
+        """
+        if self.config.provider not in _SYNTHESIS_METHODS:
+            result = await self.synthesize(raw_facts, sources, query, language)
+            yield result['natural_answer']
+            return
+
+        prompt = self._build_synthesis_prompt(raw_facts, sources, query, language)
+        started = False
+        try:
+            async for token in self._iter_tokens(prompt):
+                started = True
+                yield token
+        except Exception as e:
+            if started or not self.config.fallback_to_raw:
+                raise
+            logger.warning(f"LLM stream failed: {e}")
+            yield raw_facts
+            return
+        if not started:
+            logger.warning("LLM stream was empty, using raw facts")
+            yield raw_facts
+
+    def _iter_tokens(self, prompt: str) -> AsyncIterator[str]:
+        """Token stream of the configured provider for ``prompt``."""
+        provider = self.config.provider
+        if provider == LLMProvider.OLLAMA:
+            url = f"{self.config.ollama_host}/api/generate"
+            return self._iter_ollama_tokens(url, self._ollama_payload(prompt, True))
+        if provider == LLMProvider.ANTHROPIC:
+            url, headers, payload = self._anthropic_request(prompt, True)
+            return self._iter_anthropic_tokens(url, payload, headers)
+        build = self._groq_request if provider == LLMProvider.GROQ else self._openai_request
+        url, headers, payload = build(prompt, True)
+        return self._iter_openai_compatible_tokens(url, payload, headers)
+
+    def _input_key(self, raw_facts: str, sources: List[str], language: str) -> str:
+        """Settings plus a digest of the facts and sources (keeps keys short)."""
+        digest = hashlib.sha256(
+            "\n".join([raw_facts, *sources]).encode("utf-8")
+        ).hexdigest()
+        return f"{self._settings_key(language)} | {digest}"
+
+    def _settings_key(self, language: str) -> str:
+        """Everything besides the input that shapes a synthesis."""
+        return " | ".join((
+            self.config.provider.value,
+            self.config.model,
+            f"{self.config.temperature}",
+            f"{self.config.max_tokens}",
+            language,
+        ))
+    
     async def _synthesize_ollama(
         self,
         raw_facts: str,
@@ -167,16 +568,7 @@ class LLMSynthesizer:
         
         # Call Ollama API
         url = f"{self.config.ollama_host}/api/generate"
-        payload = {
-            "model": self.config.model,
-            "prompt": prompt,
-            "temperature": self.config.temperature,
-            "stream": self.config.stream,
-            "options": {
-                "num_predict": self.config.max_tokens,
-                "stop": ["</s>", "<|im_end|>"]  # Common stop tokens
-            }
-        }
+        payload = self._ollama_payload(prompt, self.config.stream)
         
         if self.config.stream:
             return await self._stream_ollama(url, payload)
@@ -184,7 +576,7 @@ class LLMSynthesizer:
         response = await self.client.post(url, json=payload)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         generated = result.get('response', '').strip()
         
         # If empty, return raw facts (fallback)
@@ -194,25 +586,40 @@ class LLMSynthesizer:
         
         return generated
 
+    def _ollama_payload(self, prompt: str, stream: bool) -> Dict[str, Any]:
+        """Request body for Ollama's /api/generate."""
+        return {
+            "model": self.config.model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.config.ollama_keep_alive,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens,
+                "stop": _STOP_TOKENS
+            }
+        }
+
     async def _stream_ollama(self, url: str, payload: dict) -> str:
         """Stream tokens from Ollama and collect into a single string."""
-        collected: List[str] = []
+        collected = [token async for token in self._iter_ollama_tokens(url, payload)]
+        text = "".join(collected).strip()
+        return text if len(text) >= 10 else "".join(collected)
+
+    async def _iter_ollama_tokens(self, url: str, payload: dict) -> AsyncIterator[str]:
+        """Yield Ollama's newline-delimited JSON tokens as they arrive."""
         async with self.client.stream("POST", url, json=payload) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-                import json as _json
+            async for line in _iter_byte_lines(response):
                 try:
-                    chunk = _json.loads(line)
-                    token = chunk.get("response", "")
-                    collected.append(token)
-                    if chunk.get("done"):
-                        break
-                except Exception:
+                    chunk = _json_loads(line)
+                except ValueError:
                     continue
-        text = "".join(collected).strip()
-        return text if len(text) >= 10 else "".join(collected)
+                token = chunk.get("response", "")
+                if token:
+                    yield token
+                if chunk.get("done"):
+                    break
     
     async def _synthesize_groq(
         self,
@@ -222,35 +629,8 @@ class LLMSynthesizer:
         language: str
     ) -> str:
         """Synthesize using Groq (cloud, fast)"""
-        
-        if not self.config.groq_api_key:
-            raise ValueError("Groq API key not configured")
-        
-        # Build prompt
         prompt = self._build_synthesis_prompt(raw_facts, sources, query, language)
-        
-        # Call Groq API
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.config.groq_api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "model": self.config.model,  # e.g., "mixtral-8x7b-32768"
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a synthesis assistant. Transform raw facts into natural, fluent text. Preserve all factual content. Be concise and clear."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "stream": self.config.stream,
-        }
+        url, headers, payload = self._groq_request(prompt, self.config.stream)
 
         if self.config.stream:
             return await self._stream_openai_compatible(url, payload, headers)
@@ -258,7 +638,7 @@ class LLMSynthesizer:
         response = await self.client.post(url, json=payload, headers=headers)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         return result['choices'][0]['message']['content'].strip()
 
     async def _synthesize_openai(
@@ -269,36 +649,15 @@ class LLMSynthesizer:
         language: str
     ) -> str:
         """Synthesize using OpenAI Chat Completions API."""
-        if not self.config.openai_api_key:
-            raise ValueError("OpenAI API key not configured (set OPENAI_API_KEY)")
-
         prompt = self._build_synthesis_prompt(raw_facts, sources, query, language)
-
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.config.openai_api_key}",
-            "Content-Type": "application/json",
-        }
-        payload: Dict[str, Any] = {
-            "model": self.config.model,  # e.g. "gpt-4o-mini"
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a synthesis assistant. Rewrite raw facts in natural, concise language. Preserve all factual content.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "stream": self.config.stream,
-        }
+        url, headers, payload = self._openai_request(prompt, self.config.stream)
 
         if self.config.stream:
             return await self._stream_openai_compatible(url, payload, headers)
 
         response = await self.client.post(url, json=payload, headers=headers)
         response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"].strip()
+        return _json_loads(response.content)["choices"][0]["message"]["content"].strip()
 
     async def _synthesize_anthropic(
         self,
@@ -308,33 +667,69 @@ class LLMSynthesizer:
         language: str
     ) -> str:
         """Synthesize using Anthropic Messages API."""
-        if not self.config.anthropic_api_key:
-            raise ValueError("Anthropic API key not configured (set ANTHROPIC_API_KEY)")
-
         prompt = self._build_synthesis_prompt(raw_facts, sources, query, language)
+        url, headers, payload = self._anthropic_request(prompt, self.config.stream)
+
+        if self.config.stream:
+            return await self._stream_anthropic(url, payload, headers)
 
-        url = "https://api.anthropic.com/v1/messages"
-        headers = {
-            "x-api-key": self.config.anthropic_api_key,
-            "anthropic-version": "2023-06-01",
-            "Content-Type": "application/json",
+        response = await self.client.post(url, json=payload, headers=headers)
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        return data["content"][0]["text"].strip()
+
+    # ------------------------------------------------------------------
+    # Request builders: (url, headers, payload) for each cloud provider
+    # ------------------------------------------------------------------
+
+    def _groq_request(self, prompt: str, stream: bool) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        if not self.config.groq_api_key:
+            raise ValueError("Groq API key not configured")
+        headers = _bearer_headers(self.config.groq_api_key)
+        payload = {
+            "model": self.config.model,  # e.g., "mixtral-8x7b-32768"
+            "messages": [
+                _GROQ_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "stream": stream,
+        }
+        return _GROQ_URL, headers, payload
+
+    def _openai_request(self, prompt: str, stream: bool) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        if not self.config.openai_api_key:
+            raise ValueError("OpenAI API key not configured (set OPENAI_API_KEY)")
+        headers = _bearer_headers(self.config.openai_api_key)
+        payload: Dict[str, Any] = {
+            "model": self.config.model,  # e.g. "gpt-4o-mini"
+            "messages": [
+                {"role": "system", "content": _SYNTHESIS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "stream": stream,
         }
+        return _OPENAI_URL, headers, payload
+
+    def _anthropic_request(self, prompt: str, stream: bool) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        if not self.config.anthropic_api_key:
+            raise ValueError("Anthropic API key not configured (set ANTHROPIC_API_KEY)")
+        headers = _anthropic_headers(self.config.anthropic_api_key)
         payload: Dict[str, Any] = {
             "model": self.config.model,  # e.g. "claude-3-haiku-20240307"
             "max_tokens": self.config.max_tokens,
             "temperature": self.config.temperature,
-            "stream": self.config.stream,
-            "system": "You are a synthesis assistant. Rewrite raw facts in natural, concise language. Preserve all factual content.",
+            "stream": stream,
+            "system": _SYNTHESIS_SYSTEM_PROMPT,
             "messages": [{"role": "user", "content": prompt}],
         }
-
-        if self.config.stream:
-            return await self._stream_anthropic(url, payload, headers)
-
-        response = await self.client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        return data["content"][0]["text"].strip()
+        return _ANTHROPIC_URL, headers, payload
 
     # ------------------------------------------------------------------
     # Streaming helpers
@@ -347,47 +742,61 @@ class LLMSynthesizer:
         headers: dict
     ) -> str:
         """Stream tokens from any OpenAI-compatible endpoint (OpenAI, Groq)."""
-        import json as _json
-        collected: List[str] = []
+        tokens = self._iter_openai_compatible_tokens(url, payload, headers)
+        return "".join([token async for token in tokens]).strip()
+
+    async def _stream_anthropic(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict
+    ) -> str:
+        """Stream tokens from Anthropic streaming API."""
+        tokens = self._iter_anthropic_tokens(url, payload, headers)
+        return "".join([token async for token in tokens]).strip()
+
+    async def _iter_openai_compatible_tokens(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict
+    ) -> AsyncIterator[str]:
+        """Yield content deltas from an OpenAI-compatible SSE stream."""
         async with self.client.stream("POST", url, json=payload, headers=headers) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if not line or line == "data: [DONE]":
-                    continue
-                if line.startswith("data: "):
+            async for line in _iter_byte_lines(response):
+                if line.startswith(b"data: "):
                     line = line[6:]
+                if line == b"[DONE]":
+                    continue
                 try:
-                    chunk = _json.loads(line)
+                    chunk = _json_loads(line)
                     token = chunk["choices"][0]["delta"].get("content", "")
-                    collected.append(token)
                 except Exception:
                     continue
-        return "".join(collected).strip()
+                if token:
+                    yield token
 
-    async def _stream_anthropic(
+    async def _iter_anthropic_tokens(
         self,
         url: str,
         payload: dict,
         headers: dict
-    ) -> str:
-        """Stream tokens from Anthropic streaming API."""
-        import json as _json
-        collected: List[str] = []
+    ) -> AsyncIterator[str]:
+        """Yield text deltas from Anthropic's SSE stream."""
         async with self.client.stream("POST", url, json=payload, headers=headers) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-                if line.startswith("data: "):
+            async for line in _iter_byte_lines(response):
+                if line.startswith(b"data: "):
                     line = line[6:]
                 try:
-                    chunk = _json.loads(line)
-                    if chunk.get("type") == "content_block_delta":
-                        token = chunk.get("delta", {}).get("text", "")
-                        collected.append(token)
+                    chunk = _json_loads(line)
                 except Exception:
                     continue
-        return "".join(collected).strip()
+                if chunk.get("type") == "content_block_delta":
+                    token = chunk.get("delta", {}).get("text", "")
+                    if token:
+                        yield token
     
     def _build_synthesis_prompt(
         self,
@@ -401,52 +810,82 @@ class LLMSynthesizer:
         # Auto-detect language if needed
         if language == "auto":
             # Simple language detection from query
-            if any(ord(c) > 127 for c in query):  # Non-ASCII chars
+            if not query.isascii():  # Non-ASCII chars
                 language = "the same language as the query"
             else:
                 language = "English"
         
-        # Format sources
-        sources_text = ", ".join(sources[:3]) if sources else "web sources"
-        
-        # Simpler, more direct prompt (works better with Qwen)
-        prompt = f"""You are a helpful assistant. Rewrite the following information in natural, fluent language.
-
-User asked: {query}
+        # Only the tail varies, so backends with prefix caching (Ollama,
+        # vLLM, TGI) reuse the instruction block's KV state across calls
+        return (
+            f"{_PROMPT_PREFIX}Write in {language}.\n\n"
+            f"User asked: {query}\n\n"
+            f"Information:\n{raw_facts[:500]}\n\n"
+            f"Answer:"
+        )
+    
+    async def health_check(self) -> bool:
+        """
+        Check if LLM provider is available.
 
-Information:
-{raw_facts[:500]}
+        Concurrent callers share a single in-flight probe, so several
+        demos starting at once don't each hit Ollama's /api/tags. A
+        finished probe's answer is reused for HEALTH_CHECK_TTL seconds.
+        """
+        probe = self._health_probe
+        if (
+            probe is None
+            or probe.cancelled()
+            or (probe.done() and time.monotonic() - self._health_probe_started > HEALTH_CHECK_TTL)
+        ):
+            self._health_probe = probe = asyncio.ensure_future(self._probe_health())
+            self._health_probe_started = time.monotonic()
+        return await asyncio.shield(probe)
+
+    async def warmup(self) -> None:
+        """
+        Load the Ollama model into memory ahead of the first query.
 
-Instructions:
-- Write 2-3 clear sentences in {language}
-- Keep all facts accurate
-- Be natural and conversational
-- Don't mention sources
+        Ollama loads the model without generating anything when the
+        prompt is empty. Cloud providers have nothing to warm. Failures
+        are ignored; the first real query is then just slower.
+        """
+        if self.config.provider != LLMProvider.OLLAMA:
+            return
+        try:
+            response = await self.client.post(
+                f"{self.config.ollama_host}/api/generate",
+                json={"model": self.config.model, "keep_alive": self.config.ollama_keep_alive}
+            )
+            response.raise_for_status()
+            logger.debug(f"LLM warm-up complete: {self.config.model}")
+        except Exception as e:
+            logger.debug(f"LLM warm-up failed: {e}")
 
-Answer:"""
-        
-        return prompt
-    
-    async def health_check(self) -> bool:
-        """Check if LLM provider is available"""
+    async def _probe_health(self) -> bool:
+        """Run one provider availability probe"""
         try:
             if self.config.provider == LLMProvider.OLLAMA:
                 response = await self.client.get(f"{self.config.ollama_host}/api/tags")
                 return response.status_code == 200
-            elif self.config.provider == LLMProvider.GROQ:
-                return bool(self.config.groq_api_key)
-            elif self.config.provider == LLMProvider.OPENAI:
-                return bool(self.config.openai_api_key)
-            elif self.config.provider == LLMProvider.ANTHROPIC:
-                return bool(self.config.anthropic_api_key)
-            else:
+            key_field = _API_KEY_FIELDS.get(self.config.provider)
+            if key_field is None:
                 return True  # NONE provider always available
+            return bool(getattr(self.config, key_field))
         except:
             return False
     
+    async def __aenter__(self) -> "LLMSynthesizer":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Close HTTP client (unless it was passed in by the caller); safe to repeat"""
+        self._finalizer.detach()
+        if self._owns_client and not self.client.is_closed:
+            await self.client.aclose()
 
 
 # Convenience function
@@ -454,11 +893,15 @@ async def synthesize_with_llm(
     raw_facts: str,
     sources: List[str],
     query: str,
-    config: Optional[SynthesisConfig] = None
+    config: Optional[SynthesisConfig] = None,
+    client: Optional[httpx.AsyncClient] = None
 ) -> str:
     """
     Convenience function for one-off synthesis.
     
+    Pass ``client`` to reuse one connection pool across many calls;
+    otherwise a client is opened and closed for this call alone.
+    
     Example:
         answer = await synthesize_with_llm(
             raw_facts="Python is...",
@@ -466,7 +909,7 @@ async def synthesize_with_llm(
             query="What is Python?"
         )
     """
-    synthesizer = LLMSynthesizer(config)
+    synthesizer = LLMSynthesizer(config, client=client)
     try:
         result = await synthesizer.synthesize(raw_facts, sources, query)
         return result['natural_answer']